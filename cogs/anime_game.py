@@ -2,21 +2,138 @@ import discord
 from discord.ext import commands
 import aiohttp
 import asyncio
+import base64
+import bisect
 import json
+import struct
 import time
 import os
 import random
+import itertools
+from collections import OrderedDict
+from hashlib import blake2b
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import re
 import unicodedata
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
+def _name_key(normalized_name: str) -> int:
+    """64-bit hash key for a normalized character name.
+
+    Used names are stored as integers rather than full strings: ~4-8x less
+    memory per guild and a much smaller save payload. 64-bit collisions are
+    negligible at per-guild scale.
+    """
+    return int.from_bytes(
+        blake2b(normalized_name.encode('utf-8'), digest_size=8).digest(), 'little'
+    )
+
+# Minimal AniList lookup: only the fields the game actually displays, and a
+# single most-popular anime credit, to keep response size and query
+# complexity (which AniList rate-limits on) as low as possible
+_ANILIST_QUERY = '''
+query ($search: String) {
+    Character(search: $search) {
+        id
+        name {
+            full
+            native
+        }
+        media(perPage: 1, sort: POPULARITY_DESC, type: ANIME) {
+            nodes {
+                title {
+                    romaji
+                }
+            }
+        }
+    }
+}
+'''
+
+_ANILIST_HEADERS = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+
+# XP buckets by response time (upper bound in integer nanoseconds -> XP awarded)
+_XP_TABLE = (
+    (10 * 10**9, 3000),
+    (20 * 10**9, 2000),
+    (30 * 10**9, 1500),
+    (60 * 10**9, 1000),    # 1 minute
+    (300 * 10**9, 500),    # 5 minutes
+    (1800 * 10**9, 200),   # 30 minutes
+)
+_XP_THRESHOLDS = tuple(threshold for threshold, _ in _XP_TABLE)
+_XP_VALUES = tuple(xp for _, xp in _XP_TABLE)
+_XP_FLOOR = 50  # Anything slower than 30 minutes
+
+def _format_threshold(threshold_ns: int) -> str:
+    """Human label for an XP threshold, e.g. 10s or 5min"""
+    seconds = threshold_ns // 10**9
+    return f"{seconds}s" if seconds < 60 else f"{seconds // 60}min"
+
+# Single source of truth for the reward text shown in embeds
+_XP_REWARDS_TEXT = "\n".join(
+    [f"• Under {_format_threshold(threshold)}: {xp} XP" for threshold, xp in _XP_TABLE]
+    + [f"• Over {_format_threshold(_XP_TABLE[-1][0])}: {_XP_FLOOR} XP"]
+)
+
+# Precompiled letter scanners; the ASCII class avoids Unicode-table lookups
+_FIRST_ALPHA = re.compile(r'[A-Za-z]')
+_FIRST_LETTER_UNICODE = re.compile(r'[^\W\d_]')
+_FIRST_WORD = re.compile(r'\w')
+
 class AnimeNameGame(commands.Cog):
+    # AniList response cache settings
+    ANILIST_CACHE_TTL = 86400  # 1 day for found characters
+    ANILIST_MISS_TTL = 3600    # 1 hour for not-found, so new characters surface
+    ANILIST_CACHE_MAX = 10000  # Max cached lookups
+
+    # Normalized-name memo size
+    NORM_CACHE_MAX = 4096
+
+    # Medal prefixes for the top three leaderboard slots
+    MEDALS = ('🥇 ', '🥈 ', '🥉 ')
+
+    # Circuit breaker: after this many consecutive AniList errors, skip the
+    # network entirely for the cooldown period
+    CB_FAIL_THRESHOLD = 5
+    CB_COOLDOWN = 60.0
+
     def __init__(self, bot):
         self.bot = bot
         self.game_channels: Dict[int, dict] = {}  # guild_id -> game_data
-        self.used_names: Dict[int, set] = {}  # guild_id -> set of used names
+        self.used_names: Dict[int, set] = {}  # guild_id -> set of used-name hashes
         self.user_scores: Dict[int, Dict[int, int]] = {}  # guild_id -> {user_id: xp}
-        self.current_letters: Dict[int, dict] = {}  # guild_id -> {letter, timestamp, message_id}
+        self.current_letters: Dict[int, dict] = {}  # guild_id -> {letter, timestamp, active}
+        self._ranked: Dict[int, List[Tuple[int, int]]] = {}  # guild_id -> sorted [(-xp, user_id)]
+        self._active_channel_ids: set = set()  # configured game channels, for the on_message fast path
+        self._channel_locks: Dict[int, asyncio.Lock] = {}  # channel_id -> answer-processing lock
+        self._channel_lock_refs: Dict[int, int] = {}  # channel_id -> tasks holding or awaiting the lock
+
+        # Shared HTTP session (created in cog_load) and AniList lookup cache
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # AniList rate limiting: bounded concurrency plus a header-driven
+        # pause shared by all requests (monotonic timestamp)
+        self._anilist_sem = asyncio.Semaphore(10)
+        self._anilist_blocked_until = 0.0
+
+        # Circuit breaker state for AniList outages
+        self._anilist_fail_count = 0
+        self._anilist_cb_open_until = 0.0
+        self._anilist_cache: OrderedDict = OrderedDict()  # normalized name -> (timestamp, data)
+        self._norm_cache: OrderedDict = OrderedDict()  # raw input -> normalized name
+
+        # Debounced persistence: mutators mark their guild dirty, a background
+        # task writes only the shards that changed
+        self.data_dir = Path('data/anime_game')
+        self._dirty_guilds: set = set()
+        self._save_interval = 5.0  # Seconds between save checks
+        self._saver: Optional[asyncio.Task] = None
         
         # Letter frequency weights (higher = more likely to appear)
         self.letter_weights = {
@@ -25,226 +142,447 @@ class AnimeNameGame(commands.Cog):
             'q': 5, 'r': 16, 's': 25, 't': 20, 'u': 15, 'v': 8, 'w': 10, 'x': 3,
             'y': 8, 'z': 6
         }
-        
+
+        # Precomputed draw tables so get_random_letter allocates nothing
+        self._letters = tuple(self.letter_weights.keys())
+        self._cum_weights = list(itertools.accumulate(self.letter_weights.values()))
+
+        # Pre-built embeds: the letter challenge template is copied per round
+        # with only the description swapped in; the info embed is fully static
+        self._letter_embed_template = self._build_letter_embed_template()
+        self._info_embed = self._build_info_embed()
+
         self.load_data()
-        
-    def cog_unload(self):
-        """Save data when cog is unloaded"""
+
+    def _fire_and_forget(self, coro):
+        """Run a cleanup coroutine as a detached task, logging any error"""
+        task = asyncio.create_task(coro)
+        task.add_done_callback(self._log_task_error)
+
+    def _log_task_error(self, task: asyncio.Task):
+        exc = task.exception()
+        if exc is not None and not isinstance(exc, (discord.NotFound, discord.Forbidden)):
+            self.bot.logger.error(f"Background task failed in anime game: {exc}")
+
+    def _build_letter_embed_template(self) -> discord.Embed:
+        """Static parts of the per-letter challenge embed (copied per round)"""
+        embed = discord.Embed(title="🎯 New Letter Challenge!", color=0x00aaff)
+        embed.add_field(name="XP Rewards", value=_XP_REWARDS_TEXT, inline=False)
+        embed.set_footer(text="First valid character wins!")
+        return embed
+
+    def _build_info_embed(self) -> discord.Embed:
+        """The /animegame info embed; entirely static, built once"""
+        embed = discord.Embed(
+            title="🎌 Anime Name Game (Random Letter Mode)",
+            description="Play the anime character name game with random letters!",
+            color=0x00ff00
+        )
+        embed.add_field(
+            name="How to Play",
+            value="• Random letters will be posted in the game channel\n"
+                  "• Be the first to name a valid anime character starting with that letter\n"
+                  "• Each character name can only be used once per server\n"
+                  "• Faster responses = more XP!",
+            inline=False
+        )
+        embed.add_field(
+            name="XP System",
+            value=_XP_REWARDS_TEXT,
+            inline=False
+        )
+        embed.add_field(
+            name="Slash Commands",
+            value="`/setchannel` - Set game channel\n"
+                  "`/newletter` - Generate new letter (if no active challenge)\n"
+                  "`/leaderboard` - View XP leaderboard\n"
+                  "`/stats` - View your stats\n"
+                  "`/resetgame` - Reset game (Admin only)",
+            inline=False
+        )
+        return embed
+
+    def _make_session(self) -> aiohttp.ClientSession:
+        """Build the pooled HTTP session used for AniList requests"""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            ),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+
+    async def cog_load(self):
+        """Create the shared HTTP session and start the background saver"""
+        self._session = self._make_session()
+        self._saver = asyncio.create_task(self._save_loop())
+
+    async def cog_unload(self):
+        """Save data and close the HTTP session when cog is unloaded"""
+        if self._saver:
+            self._saver.cancel()
         self.save_data()
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    async def _save_loop(self):
+        """Periodically flush dirty guild shards to disk off the event loop"""
+        while True:
+            await asyncio.sleep(self._save_interval)
+            if self._dirty_guilds:
+                dirty = self._dirty_guilds
+                self._dirty_guilds = set()
+                await asyncio.to_thread(self._save_guilds, dirty)
+
+    def mark_dirty(self, guild_id: int):
+        """Flag a guild's game data as changed; the background saver picks it up"""
+        self._dirty_guilds.add(guild_id)
 
     def load_data(self):
-        """Load game data from environment variables or file"""
+        """Load game data from per-guild shard files (with legacy fallbacks)"""
         try:
-            # Try to load from environment variable first (for Railway/Heroku)
+            shard_files = sorted(self.data_dir.glob('*.json')) if self.data_dir.exists() else []
+            if shard_files:
+                for shard in shard_files:
+                    try:
+                        guild_id = int(shard.stem)
+                    except ValueError:
+                        continue  # Not a guild shard
+                    try:
+                        raw = shard.read_bytes()
+                        data = orjson.loads(raw) if orjson else json.loads(raw)
+                    except Exception as e:
+                        self.bot.logger.error(f"Error loading anime game shard {shard.name}: {e}")
+                        continue
+                    self._load_guild(guild_id, data)
+                return
+
+            # Legacy fallback: environment variable or the old monolithic file
             data_str = os.getenv('ANIME_GAME_DATA')
             if data_str:
                 data = json.loads(data_str)
             else:
-                # Fallback to file for local development
                 try:
-                    with open('anime_game_data.json', 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    with open('anime_game_data.json', 'rb') as f:
+                        raw = f.read()
+                    data = orjson.loads(raw) if orjson else json.loads(raw)
                 except FileNotFoundError:
                     data = {}
-            
+
             # Convert string keys back to integers for guild/user IDs
             self.game_channels = {int(k): v for k, v in data.get('game_channels', {}).items()}
-            self.used_names = {int(k): set(v) for k, v in data.get('used_names', {}).items()}
+            # Keep the on_message gate in sync with the legacy channels too,
+            # or every game channel gets silently ignored until /setchannel
+            for channel_info in self.game_channels.values():
+                if 'channel_id' in channel_info:
+                    self._active_channel_ids.add(channel_info['channel_id'])
+            self.used_names = {
+                int(k): {_name_key(self.normalize_name(name)) for name in v}
+                for k, v in data.get('used_names', {}).items()
+            }
             self.user_scores = {
                 int(guild_id): {int(user_id): score for user_id, score in users.items()}
                 for guild_id, users in data.get('user_scores', {}).items()
             }
             self.current_letters = {int(k): v for k, v in data.get('current_letters', {}).items()}
-            
+
+            for loaded_guild_id in self.user_scores:
+                self._rebuild_rank(loaded_guild_id)
+
+            # Eager migration: flag every legacy guild so the saver writes
+            # its shard on the first pass. Once any shard exists, later
+            # startups take the shard branch and never read this data
+            # again, so a guild left shardless here would be lost
+            for legacy_guild_id in (
+                self.game_channels.keys() | self.used_names.keys()
+                | self.user_scores.keys() | self.current_letters.keys()
+            ):
+                self.mark_dirty(legacy_guild_id)
+
         except Exception as e:
             self.bot.logger.error(f"Error loading anime game data: {e}")
 
-    def save_data(self):
-        """Save game data to environment variable or file"""
-        try:
-            data = {
-                'game_channels': {str(k): v for k, v in self.game_channels.items()},
-                'used_names': {str(k): list(v) for k, v in self.used_names.items()},
-                'user_scores': {
-                    str(guild_id): {str(user_id): score for user_id, score in users.items()}
-                    for guild_id, users in self.user_scores.items()
-                },
-                'current_letters': {str(k): v for k, v in self.current_letters.items()}
+    def _load_guild(self, guild_id: int, data: dict):
+        """Populate in-memory state from one guild's shard"""
+        self.game_channels[guild_id] = data.get('game_channel', {})
+        if 'channel_id' in self.game_channels[guild_id]:
+            self._active_channel_ids.add(self.game_channels[guild_id]['channel_id'])
+
+        used = data.get('used_names', [])
+        if isinstance(used, str):
+            # Packed base64 blob of 64-bit name hashes
+            raw = base64.b64decode(used)
+            self.used_names[guild_id] = set(struct.unpack(f'<{len(raw) // 8}Q', raw))
+        else:
+            # Legacy list of normalized name strings
+            self.used_names[guild_id] = {
+                _name_key(self.normalize_name(name)) for name in used
             }
-            
-            data_str = json.dumps(data, ensure_ascii=False)
-            
-            # Save to environment variable for Railway/Heroku
-            os.environ['ANIME_GAME_DATA'] = data_str
-            
-            # Also save to file for local development
+        self.user_scores[guild_id] = {
+            int(user_id): score for user_id, score in data.get('user_scores', {}).items()
+        }
+        self.current_letters[guild_id] = data.get('current_letter', {})
+        self._rebuild_rank(guild_id)
+
+    def _rebuild_rank(self, guild_id: int):
+        """Rebuild the sorted leaderboard for one guild from user_scores"""
+        self._ranked[guild_id] = sorted(
+            (-xp, user_id) for user_id, xp in self.user_scores.get(guild_id, {}).items()
+        )
+
+    def _get_rank_list(self, guild_id: int) -> List[Tuple[int, int]]:
+        """Get (building if needed) the sorted leaderboard for a guild"""
+        ranked = self._ranked.get(guild_id)
+        if ranked is None:
+            self._rebuild_rank(guild_id)
+            ranked = self._ranked[guild_id]
+        return ranked
+
+    def _update_rank(self, guild_id: int, user_id: int, old_xp: int, new_xp: int):
+        """Incrementally move one user within the sorted leaderboard"""
+        ranked = self._ranked.get(guild_id)
+        if ranked is None:
+            # user_scores already holds new_xp by the time we're called, so
+            # a fresh rebuild includes this user; inserting again would
+            # leave a duplicate entry behind
+            self._rebuild_rank(guild_id)
+            return
+        if old_xp:
+            index = bisect.bisect_left(ranked, (-old_xp, user_id))
+            if index < len(ranked) and ranked[index] == (-old_xp, user_id):
+                ranked.pop(index)
+        bisect.insort(ranked, (-new_xp, user_id))
+
+    def _guild_payload(self, guild_id: int) -> dict:
+        """Build the JSON-serializable shard for one guild"""
+        used = self.used_names.get(guild_id, ())
+        return {
+            'game_channel': self.game_channels.get(guild_id, {}),
+            'used_names': base64.b64encode(
+                struct.pack(f'<{len(used)}Q', *sorted(used))
+            ).decode('ascii'),
+            'user_scores': {
+                str(user_id): score
+                for user_id, score in self.user_scores.get(guild_id, {}).items()
+            },
+            'current_letter': self.current_letters.get(guild_id, {})
+        }
+
+    def _save_guilds(self, guild_ids):
+        """Write the shard files for the given guilds"""
+        for guild_id in guild_ids:
+            self._save_guild(guild_id)
+
+    def _save_guild(self, guild_id: int):
+        """Save one guild's game data atomically"""
+        try:
+            data = self._guild_payload(guild_id)
+
+            # Compact encoding: smaller blob, fewer bytes to write
+            if orjson:
+                payload = orjson.dumps(data)
+            else:
+                payload = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+            # Atomic tmp + replace so a crash never leaves a torn shard
             try:
-                with open('anime_game_data.json', 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-            except:
+                self.data_dir.mkdir(parents=True, exist_ok=True)
+                temp_file = self.data_dir / f'{guild_id}.json.tmp'
+                with open(temp_file, 'wb', buffering=65536) as f:
+                    f.write(payload)
+                os.replace(temp_file, self.data_dir / f'{guild_id}.json')
+            except OSError:
                 pass  # Don't fail if file can't be written (read-only filesystem)
-                
+
         except Exception as e:
-            self.bot.logger.error(f"Error saving anime game data: {e}")
+            self.bot.logger.error(f"Error saving anime game data for guild {guild_id}: {e}")
+
+    def save_data(self):
+        """Flush every guild's game data to disk"""
+        guild_ids = (set(self.game_channels) | set(self.used_names) |
+                     set(self.user_scores) | set(self.current_letters))
+        self._save_guilds(guild_ids)
 
     def normalize_name(self, name: str) -> str:
         """Normalize character name for comparison"""
-        # Remove extra spaces and convert to lowercase
-        name = ' '.join(name.strip().split()).lower()
-        
-        # Remove common prefixes/suffixes and normalize
-        name = unicodedata.normalize('NFKD', name)
-        
-        return name
+        cached = self._norm_cache.get(name)
+        if cached is not None:
+            return cached
+
+        # Collapse whitespace and casefold (handles ß etc. beyond plain lower)
+        normalized = ' '.join(name.split()).casefold()
+
+        # ASCII input (the common case for romaji) needs no Unicode
+        # normalization; otherwise NFKC recomposes to canonical form so
+        # e.g. a combining accent and its precomposed character dedupe
+        if not normalized.isascii():
+            normalized = unicodedata.normalize('NFKC', normalized)
+
+        # Memoize (bounded so it can't grow without limit)
+        self._norm_cache[name] = normalized
+        if len(self._norm_cache) > self.NORM_CACHE_MAX:
+            self._norm_cache.popitem(last=False)
+
+        return normalized
+
+    @staticmethod
+    def _first_letter_of(lowered: str) -> str:
+        """First meaningful letter of an already-lowercased string"""
+        # Single search pass, no throwaway cleaned-up intermediate string
+        pattern = _FIRST_ALPHA if lowered.isascii() else _FIRST_LETTER_UNICODE
+        match = pattern.search(lowered)
+        if match:
+            return match.group(0)
+
+        # No alphabetic character at all: first word character (e.g. a digit)
+        match = _FIRST_WORD.search(lowered)
+        return match.group(0) if match else ''
 
     def get_first_letter(self, name: str) -> str:
         """Get the first meaningful letter from a name"""
-        # Remove spaces and punctuation, get first alphabetic character
-        clean_name = re.sub(r'[^\w]', '', name.lower())
-        
-        for char in clean_name:
-            if char.isalpha():
-                return char
-        
-        return clean_name[0] if clean_name else ''
+        return self._first_letter_of(name.lower())
+
+    def _analyze_name(self, name: str) -> Tuple[str, str]:
+        """Normalize a name and pull its first letter from the same string"""
+        normalized = self.normalize_name(name)
+        return normalized, self._first_letter_of(normalized)
+
+    @staticmethod
+    def _plausible_name(raw: str, normalized: str) -> bool:
+        """Cheap sanity filters that reject junk before an API round trip"""
+        if not 2 <= len(raw) <= 64:
+            return False
+        if raw.startswith(('http://', 'https://')):
+            return False
+        # Romaji needs at least one vowel; skip the check for non-ASCII scripts
+        if normalized.isascii() and not any(c in 'aeiouy' for c in normalized):
+            return False
+        return True
 
     def get_random_letter(self) -> str:
         """Get a random letter based on weights"""
-        letters = list(self.letter_weights.keys())
-        weights = list(self.letter_weights.values())
-        return random.choices(letters, weights=weights)[0]
+        return random.choices(self._letters, cum_weights=self._cum_weights)[0]
 
     async def search_anilist_character(self, name: str) -> Optional[dict]:
         """Search for character on AniList API"""
-        query = '''
-        query ($search: String) {
-            Character(search: $search) {
-                id
-                name {
-                    full
-                    native
-                    alternative
-                }
-                media {
-                    nodes {
-                        title {
-                            romaji
-                            english
-                        }
-                        type
-                    }
-                }
-            }
-        }
-        '''
-        
+        query = _ANILIST_QUERY
         variables = {'search': name}
-        
+
+        # Check the cache first to avoid repeated network calls
+        cache_key = self.normalize_name(name)
+        cached = self._anilist_cache.get(cache_key)
+        if cached is not None:
+            timestamp, character = cached
+            ttl = self.ANILIST_CACHE_TTL if character is not None else self.ANILIST_MISS_TTL
+            if time.monotonic() - timestamp < ttl:
+                self._anilist_cache.move_to_end(cache_key)
+                return character
+            del self._anilist_cache[cache_key]
+
+        # Circuit open: AniList has been failing, don't stall the event loop
+        # waiting out the timeout for every message
+        if time.monotonic() < self._anilist_cb_open_until:
+            return None
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    'https://graphql.anilist.co',
-                    json={'query': query, 'variables': variables},
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data.get('data', {}).get('Character')
+            # Lazily create the session in case the cog was loaded without cog_load
+            if self._session is None or self._session.closed:
+                self._session = self._make_session()
+
+            async with self._anilist_sem:
+                # Honor any pause set by earlier rate-limit responses
+                wait = self._anilist_blocked_until - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                for attempt in range(3):
+                    # Pre-encode the body with orjson when available; aiohttp's
+                    # json= kwarg would re-serialize with stdlib json per request
+                    if orjson:
+                        request = self._session.post(
+                            'https://graphql.anilist.co',
+                            data=orjson.dumps({'query': query, 'variables': variables}),
+                            headers=_ANILIST_HEADERS
+                        )
                     else:
-                        return None
+                        request = self._session.post(
+                            'https://graphql.anilist.co',
+                            json={'query': query, 'variables': variables}
+                        )
+
+                    async with request as resp:
+                        if resp.status == 429:
+                            # Back off for everyone; retry with exponential
+                            # delay seeded from Retry-After
+                            retry_after = float(resp.headers.get('Retry-After', 1))
+                            delay = retry_after * (2 ** attempt)
+                            self._anilist_blocked_until = time.monotonic() + delay
+                            if attempt < 2:
+                                await asyncio.sleep(delay)
+                                continue
+                            return None
+
+                        # Pre-emptively pause before the bucket actually runs dry
+                        remaining = resp.headers.get('X-RateLimit-Remaining')
+                        if remaining is not None and int(remaining) <= 1:
+                            reset = resp.headers.get('X-RateLimit-Reset')
+                            if reset:
+                                delay = max(0.0, float(reset) - time.time())
+                                self._anilist_blocked_until = time.monotonic() + min(delay, 60.0)
+
+                        if resp.status == 200:
+                            data = await resp.json()
+                            character = data.get('data', {}).get('Character')
+                            self._anilist_fail_count = 0
+
+                            # Cache the result (bounded LRU)
+                            self._anilist_cache[cache_key] = (time.monotonic(), character)
+                            self._anilist_cache.move_to_end(cache_key)
+                            while len(self._anilist_cache) > self.ANILIST_CACHE_MAX:
+                                self._anilist_cache.popitem(last=False)
+
+                            return character
+                        else:
+                            return None
+                return None
         except Exception as e:
             self.bot.logger.error(f"AniList API error: {e}")
+            self._anilist_fail_count += 1
+            if self._anilist_fail_count >= self.CB_FAIL_THRESHOLD:
+                self._anilist_cb_open_until = time.monotonic() + self.CB_COOLDOWN
+                self._anilist_fail_count = 0
             return None
 
-    def calculate_xp(self, time_taken: float) -> int:
-        """Calculate XP based on response time"""
-        if time_taken <= 10:
-            return 3000
-        elif time_taken <= 20:
-            return 2000
-        elif time_taken <= 30:
-            return 1500
-        elif time_taken <= 60:  # 1 minute
-            return 1000
-        elif time_taken <= 300:  # 5 minutes
-            return 500
-        elif time_taken <= 1800:  # 30 minutes
-            return 200
-        else:
-            return 50
+    def calculate_xp(self, time_taken_ns: int) -> int:
+        """Calculate XP from an integer-nanosecond response time"""
+        index = bisect.bisect_left(_XP_THRESHOLDS, time_taken_ns)
+        return _XP_VALUES[index] if index < len(_XP_VALUES) else _XP_FLOOR
 
     async def send_new_letter(self, channel, guild_id: int):
         """Send a new random letter challenge"""
         letter = self.get_random_letter()
-        current_time = time.time()
-        
-        embed = discord.Embed(
-            title="🎯 New Letter Challenge!",
-            description=f"Name an anime character that starts with **{letter.upper()}**!",
-            color=0x00aaff
-        )
-        embed.add_field(
-            name="XP Rewards",
-            value="• Under 10s: 3000 XP\n"
-                  "• Under 20s: 2000 XP\n"
-                  "• Under 30s: 1500 XP\n"
-                  "• Under 1min: 1000 XP\n"
-                  "• Under 5min: 500 XP\n"
-                  "• Under 30min: 200 XP\n"
-                  "• Over 30min: 50 XP",
-            inline=False
-        )
-        embed.set_footer(text="First valid character wins!")
-        
-        message = await channel.send(embed=embed)
+        current_time = time.time_ns()
         
+        embed = self._letter_embed_template.copy()
+        embed.description = f"Name an anime character that starts with **{letter.upper()}**!"
+
+        await channel.send(embed=embed)
+
         # Store current letter challenge
         self.current_letters[guild_id] = {
             'letter': letter,
             'timestamp': current_time,
-            'message_id': message.id,
             'active': True
         }
         
-        self.save_data()
+        self.mark_dirty(guild_id)
 
     @discord.app_commands.command(name='animegame', description='Show anime name game info and commands')
     async def anime_game_info(self, interaction: discord.Interaction):
         """Show anime name game information"""
-        embed = discord.Embed(
-            title="🎌 Anime Name Game (Random Letter Mode)",
-            description="Play the anime character name game with random letters!",
-            color=0x00ff00
-        )
-        embed.add_field(
-            name="How to Play",
-            value="• Random letters will be posted in the game channel\n"
-                  "• Be the first to name a valid anime character starting with that letter\n"
-                  "• Each character name can only be used once per server\n"
-                  "• Faster responses = more XP!",
-            inline=False
-        )
-        embed.add_field(
-            name="XP System",
-            value="• Under 10s: 3000 XP\n"
-                  "• Under 20s: 2000 XP\n"
-                  "• Under 30s: 1500 XP\n"
-                  "• Under 1min: 1000 XP\n"
-                  "• Under 5min: 500 XP\n"
-                  "• Under 30min: 200 XP\n"
-                  "• Over 30min: 50 XP",
-            inline=False
-        )
-        embed.add_field(
-            name="Slash Commands",
-            value="`/setchannel` - Set game channel\n"
-                  "`/newletter` - Generate new letter (if no active challenge)\n"
-                  "`/leaderboard` - View XP leaderboard\n"
-                  "`/stats` - View your stats\n"
-                  "`/resetgame` - Reset game (Admin only)",
-            inline=False
-        )
-        await interaction.response.send_message(embed=embed)
+        await interaction.response.send_message(embed=self._info_embed)
 
     @discord.app_commands.command(name='setchannel', description='Set the anime name game channel')
     @discord.app_commands.describe(channel='The channel to set as game channel (current channel if not specified)')
@@ -263,8 +601,12 @@ class AnimeNameGame(commands.Cog):
             self.user_scores[guild_id] = {}
             self.current_letters[guild_id] = {}
         
+        old_channel_id = self.game_channels[guild_id].get('channel_id')
+        if old_channel_id is not None:
+            self._active_channel_ids.discard(old_channel_id)
         self.game_channels[guild_id]['channel_id'] = channel.id
-        self.save_data()
+        self._active_channel_ids.add(channel.id)
+        self.mark_dirty(guild_id)
         
         embed = discord.Embed(
             title="✅ Game Channel Set",
@@ -324,47 +666,46 @@ class AnimeNameGame(commands.Cog):
             await interaction.response.send_message("📊 No scores recorded yet! Start playing to see the leaderboard.")
             return
         
-        # Sort users by XP
-        sorted_users = sorted(
-            self.user_scores[guild_id].items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        
+        # Leaderboard is kept sorted incrementally; just slice the page
+        ranked = self._get_rank_list(guild_id)
+
         # Pagination
         per_page = 10
-        total_pages = (len(sorted_users) + per_page - 1) // per_page
+        total_pages = (len(ranked) + per_page - 1) // per_page
         page = max(1, min(page, total_pages))
-        
+
         start_idx = (page - 1) * per_page
         end_idx = start_idx + per_page
-        page_users = sorted_users[start_idx:end_idx]
-        
+        page_users = [(user_id, -neg_xp) for neg_xp, user_id in ranked[start_idx:end_idx]]
+
+        await interaction.response.defer()
+
+        # Resolve names from the guild's member cache; batch-fetch whatever is
+        # missing in a single gateway query instead of N individual misses
+        guild = interaction.guild
+        missing = [user_id for user_id, _ in page_users if guild.get_member(user_id) is None]
+        if missing:
+            try:
+                await guild.query_members(user_ids=missing, cache=True)
+            except (discord.HTTPException, asyncio.TimeoutError):
+                pass  # Fall back to whatever is cached
+
         embed = discord.Embed(
             title="🏆 Anime Name Game Leaderboard",
             color=0xffd700
         )
-        
-        leaderboard_text = ""
+
+        lines = []
         for i, (user_id, xp) in enumerate(page_users, start=start_idx + 1):
-            user = self.bot.get_user(user_id)
-            username = user.display_name if user else f"Unknown User ({user_id})"
-            
-            # Add medal emojis for top 3
-            medal = ""
-            if i == 1:
-                medal = "🥇 "
-            elif i == 2:
-                medal = "🥈 "
-            elif i == 3:
-                medal = "🥉 "
-            
-            leaderboard_text += f"{medal}**{i}.** {username} - {xp:,} XP\n"
-        
-        embed.description = leaderboard_text
-        embed.set_footer(text=f"Page {page}/{total_pages} • Total Players: {len(sorted_users)}")
-        
-        await interaction.response.send_message(embed=embed)
+            member = guild.get_member(user_id)
+            username = member.display_name if member else f"Unknown User ({user_id})"
+            medal = self.MEDALS[i - 1] if i <= 3 else ""
+            lines.append(f"{medal}**{i}.** {username} - {xp:,} XP")
+
+        embed.description = "\n".join(lines)
+        embed.set_footer(text=f"Page {page}/{total_pages} • Total Players: {len(ranked)}")
+
+        await interaction.followup.send(embed=embed)
 
     @discord.app_commands.command(name='stats', description='Show anime game stats for a user')
     @discord.app_commands.describe(user='User to check stats for (yourself if not specified)')
@@ -381,15 +722,10 @@ class AnimeNameGame(commands.Cog):
             return
         
         xp = self.user_scores[guild_id][user_id]
-        
-        # Find user's rank
-        sorted_users = sorted(
-            self.user_scores[guild_id].items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        
-        rank = next((i + 1 for i, (uid, _) in enumerate(sorted_users) if uid == user_id), 0)
+
+        # O(log N) rank lookup in the incrementally sorted leaderboard
+        ranked = self._get_rank_list(guild_id)
+        rank = bisect.bisect_left(ranked, (-xp, user_id)) + 1
         
         embed = discord.Embed(
             title=f"📊 {user.display_name}'s Stats",
@@ -397,7 +733,7 @@ class AnimeNameGame(commands.Cog):
         )
         embed.add_field(name="XP", value=f"{xp:,}", inline=True)
         embed.add_field(name="Rank", value=f"#{rank}", inline=True)
-        embed.add_field(name="Total Players", value=f"{len(sorted_users)}", inline=True)
+        embed.add_field(name="Total Players", value=f"{len(ranked)}", inline=True)
         
         embed.set_thumbnail(url=user.display_avatar.url)
         await interaction.response.send_message(embed=embed)
@@ -431,10 +767,11 @@ class AnimeNameGame(commands.Cog):
                 self.used_names[guild_id].clear()
             if guild_id in self.user_scores:
                 self.user_scores[guild_id].clear()
+            self._ranked.pop(guild_id, None)
             if guild_id in self.current_letters:
                 self.current_letters[guild_id].clear()
             
-            self.save_data()
+            self.mark_dirty(guild_id)
             
             embed = discord.Embed(
                 title="✅ Game Reset",
@@ -460,137 +797,169 @@ class AnimeNameGame(commands.Cog):
     @commands.Cog.listener()
     async def on_message(self, message):
         """Handle messages in game channels"""
-        if message.author.bot:
+        # Single set lookup rejects every message outside a game channel
+        # before any other work; this listener runs for the whole bot
+        if message.channel.id not in self._active_channel_ids:
             return
-        
-        guild_id = message.guild.id
-        channel_id = message.channel.id
-        
-        # Check if this is a game channel
-        if (guild_id not in self.game_channels or 
-            self.game_channels[guild_id].get('channel_id') != channel_id):
+
+        if message.author.bot or not message.guild:
             return
-        
-        # Initialize guild data if needed
-        if guild_id not in self.used_names:
-            self.used_names[guild_id] = set()
-        if guild_id not in self.user_scores:
-            self.user_scores[guild_id] = {}
-        if guild_id not in self.current_letters:
-            self.current_letters[guild_id] = {}
-        
+
+        guild_id = message.guild.id
+
         character_name = message.content.strip()
-        
+
         # Skip if empty or command
         if not character_name or character_name.startswith(('/', '!!')):
             return
-        
+
         # Check if there's an active letter challenge
-        if not self.current_letters[guild_id].get('active', False):
-            return
-        
-        required_letter = self.current_letters[guild_id]['letter']
-        challenge_timestamp = self.current_letters[guild_id]['timestamp']
-        
-        # Check if name was already used
-        normalized_name = self.normalize_name(character_name)
-        if normalized_name in self.used_names[guild_id]:
-            embed = discord.Embed(
-                title="❌ Name Already Used",
-                description=f"The name **{character_name}** has already been used!",
-                color=0xff0000
-            )
-            await message.reply(embed=embed, delete_after=10)
-            await message.delete(delay=2)
-            return
-        
-        # Check if starts with correct letter
-        first_letter = self.get_first_letter(character_name)
-        if first_letter != required_letter:
-            embed = discord.Embed(
-                title="❌ Wrong Starting Letter",
-                description=f"The name must start with **{required_letter.upper()}**\n"
-                           f"Your name starts with **{first_letter.upper()}**",
-                color=0xff0000
-            )
-            await message.reply(embed=embed, delete_after=10)
-            await message.delete(delay=2)
+        current_letter = self.current_letters.get(guild_id)
+        if not current_letter or not current_letter.get('active', False):
             return
-        
-        # Verify character exists on AniList
-        async with message.channel.typing():
-            character_data = await self.search_anilist_character(character_name)
-        
-        if not character_data:
-            embed = discord.Embed(
-                title="❌ Character Not Found",
-                description=f"**{character_name}** was not found in the AniList database.\n"
-                           "Please use a valid anime character name.",
-                color=0xff0000
-            )
-            await message.reply(embed=embed, delete_after=15)
-            await message.delete(delay=2)
-            return
-        
-        # Calculate XP based on response time
-        current_time = time.time()
-        time_taken = current_time - challenge_timestamp
-        xp_gained = self.calculate_xp(time_taken)
-        
-        # Add to used names and update scores
-        self.used_names[guild_id].add(normalized_name)
-        
-        user_id = message.author.id
-        if user_id not in self.user_scores[guild_id]:
-            self.user_scores[guild_id][user_id] = 0
-        self.user_scores[guild_id][user_id] += xp_gained
-        
-        # Deactivate current challenge
-        self.current_letters[guild_id]['active'] = False
-        
-        # Save data
-        self.save_data()
-        
-        # Create success embed
-        embed = discord.Embed(
-            title="🎉 Correct Answer!",
-            description=f"**{character_name}** by {message.author.mention}",
-            color=0x00ff00
-        )
-        
-        # Add character info
-        char_name = character_data.get('name', {})
-        full_name = char_name.get('full', character_name)
-        if char_name.get('native'):
-            embed.add_field(name="Native Name", value=char_name['native'], inline=True)
-        
-        # Add anime info
-        media = character_data.get('media', {}).get('nodes', [])
-        if media:
-            # Filter for anime only
-            anime_media = [m for m in media if m.get('type') == 'ANIME']
-            if anime_media:
-                anime_title = anime_media[0].get('title', {}).get('romaji', 'Unknown')
-                embed.add_field(name="From Anime", value=anime_title, inline=True)
-        
-        embed.add_field(name="XP Gained", value=f"+{xp_gained:,} XP", inline=True)
-        
-        # Format time taken
-        if time_taken < 60:
-            time_str = f"{time_taken:.1f}s"
-        elif time_taken < 3600:
-            time_str = f"{time_taken/60:.1f}m"
-        else:
-            time_str = f"{time_taken/3600:.1f}h"
-        embed.add_field(name="Response Time", value=time_str, inline=True)
-        
-        embed.set_footer(text=f"Total XP: {self.user_scores[guild_id][user_id]:,}")
-        
-        await message.reply(embed=embed)
-        
-        # Wait a bit then send new letter challenge
-        await asyncio.sleep(3)
-        await self.send_new_letter(message.channel, guild_id)
+
+        # Validate concurrently so a slow AniList call in one guild cannot
+        # stall answers in another; the per-channel lock preserves ordering
+        asyncio.create_task(self._process_answer(message, guild_id, character_name))
+
+    async def _process_answer(self, message, guild_id: int, character_name: str):
+        """Validate and score one candidate answer (serialized per channel)"""
+        channel_id = message.channel.id
+        lock = self._channel_locks.setdefault(channel_id, asyncio.Lock())
+        self._channel_lock_refs[channel_id] = self._channel_lock_refs.get(channel_id, 0) + 1
+        try:
+            async with lock:
+                # Re-check under the lock: an earlier answer may have already
+                # closed this challenge while we waited
+                current_letter = self.current_letters.get(guild_id)
+                if not current_letter or not current_letter.get('active', False):
+                    return
+
+                # Only now touch the rest of the per-guild state; bound to locals so
+                # the hot path below never re-hashes guild_id
+                used_names = self.used_names.setdefault(guild_id, set())
+                user_scores = self.user_scores.setdefault(guild_id, {})
+
+                required_letter = current_letter['letter']
+                challenge_timestamp = current_letter['timestamp']
+                if challenge_timestamp < 10**12:
+                    # Legacy challenges stored float seconds; upgrade to integer ns
+                    challenge_timestamp = int(challenge_timestamp * 10**9)
+        
+                # One pass over the name: normalization feeds both the used-name key
+                # and the first-letter check
+                normalized_name, first_letter = self._analyze_name(character_name)
+                name_key = _name_key(normalized_name)
+                if name_key in used_names:
+                    embed = discord.Embed(
+                        title="❌ Name Already Used",
+                        description=f"The name **{character_name}** has already been used!",
+                        color=0xff0000
+                    )
+                    self._fire_and_forget(message.reply(embed=embed, delete_after=10))
+                    self._fire_and_forget(message.delete(delay=2))
+                    return
+        
+                # Check if starts with correct letter
+                if first_letter != required_letter:
+                    embed = discord.Embed(
+                        title="❌ Wrong Starting Letter",
+                        description=f"The name must start with **{required_letter.upper()}**\n"
+                                   f"Your name starts with **{first_letter.upper()}**",
+                        color=0xff0000
+                    )
+                    self._fire_and_forget(message.reply(embed=embed, delete_after=10))
+                    self._fire_and_forget(message.delete(delay=2))
+                    return
+        
+                # Verify character exists on AniList; obvious junk skips the
+                # network and falls straight into the not-found reply
+                if not self._plausible_name(character_name, normalized_name):
+                    character_data = None
+                else:
+                    async with message.channel.typing():
+                        character_data = await self.search_anilist_character(character_name)
+        
+                if not character_data:
+                    embed = discord.Embed(
+                        title="❌ Character Not Found",
+                        description=f"**{character_name}** was not found in the AniList database.\n"
+                                   "Please use a valid anime character name.",
+                        color=0xff0000
+                    )
+                    self._fire_and_forget(message.reply(embed=embed, delete_after=15))
+                    self._fire_and_forget(message.delete(delay=2))
+                    return
+        
+                # Calculate XP based on response time (integer ns, no float math)
+                time_taken_ns = time.time_ns() - challenge_timestamp
+                xp_gained = self.calculate_xp(time_taken_ns)
+        
+                # Add to used names and update scores
+                used_names.add(name_key)
+
+                user_id = message.author.id
+                old_xp = user_scores.get(user_id, 0)
+                new_xp = old_xp + xp_gained
+                user_scores[user_id] = new_xp
+                self._update_rank(guild_id, user_id, old_xp, new_xp)
+
+                # Deactivate current challenge
+                current_letter['active'] = False
+        
+                # Save data
+                self.mark_dirty(guild_id)
+        
+                # Create success embed
+                embed = discord.Embed(
+                    title="🎉 Correct Answer!",
+                    description=f"**{character_name}** by {message.author.mention}",
+                    color=0x00ff00
+                )
+        
+                # Add character info
+                char_name = character_data.get('name', {})
+                full_name = char_name.get('full', character_name)
+                if char_name.get('native'):
+                    embed.add_field(name="Native Name", value=char_name['native'], inline=True)
+        
+                # Add anime info (query already filters to the most popular anime)
+                media = character_data.get('media', {}).get('nodes', [])
+                if media:
+                    anime_title = media[0].get('title', {}).get('romaji', 'Unknown')
+                    embed.add_field(name="From Anime", value=anime_title, inline=True)
+        
+                embed.add_field(name="XP Gained", value=f"+{xp_gained:,} XP", inline=True)
+        
+                # Format time taken (seconds only needed for display)
+                time_taken = time_taken_ns / 1_000_000_000
+                if time_taken < 60:
+                    time_str = f"{time_taken:.1f}s"
+                elif time_taken < 3600:
+                    time_str = f"{time_taken/60:.1f}m"
+                else:
+                    time_str = f"{time_taken/3600:.1f}h"
+                embed.add_field(name="Response Time", value=time_str, inline=True)
+        
+                embed.set_footer(text=f"Total XP: {new_xp:,}")
+        
+                await message.reply(embed=embed)
+        
+                # Wait a bit then send new letter challenge
+                await asyncio.sleep(3)
+                await self.send_new_letter(message.channel, guild_id)
+        finally:
+            # Drop the lock entry only when the last task using it leaves.
+            # Lock.locked() is False the moment it's released even with
+            # waiters still queued, so the refcount is what keeps a waiter
+            # from being stranded on a lock no longer in the map
+            refs = self._channel_lock_refs[channel_id] - 1
+            if refs:
+                self._channel_lock_refs[channel_id] = refs
+            else:
+                del self._channel_lock_refs[channel_id]
+                if self._channel_locks.get(channel_id) is lock:
+                    del self._channel_locks[channel_id]
 
 class ConfirmView(discord.ui.View):
     def __init__(self):
@@ -1,42 +1,153 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
 import json
 import os
 import re
 import asyncio
 import logging
+import random
+import string
+import time
+from collections import defaultdict, OrderedDict
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
+# Precompiled validators; these run on every /customrole invocation
+_RE_BAD_NAME = re.compile(r'[@#`\\*_~|]')
+_RE_WS = re.compile(r'\s{3,}')
+
 class CustomRoles(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.logger = logging.getLogger(__name__)
+
+        # Single state file; the two legacy paths remain for one-time migration
+        self.state_file = 'data/custom_roles_state.json'
         self.custom_roles_file = 'data/custom_roles.json'
         self.user_roles_file = 'data/user_custom_roles.json'
-        self.custom_roles = self.load_custom_roles()
-        self.user_custom_roles = self.load_user_custom_roles()
+        self.custom_roles, self.user_custom_roles = self.load_state()
         
         # Role ID to place custom roles above
         self.target_role_id = 932258813770338404
-        
-        # Enhanced caching and rate limiting
+
+        # Bot user id, snapshotted once ready so hot paths skip the
+        # bot.user attribute chain
+        self._bot_user_id: Optional[int] = None
+        
+        # Enhanced caching and rate limiting. The guild cache maps guild_id
+        # to (monotonic expiry, scalar snapshot); it holds no Member/Role
+        # references so stale objects can't outlive guild role edits
+        # Both caches are LRU-bounded so a long-running bot in many guilds
+        # can't grow them without limit
         self._role_cache = {}
-        self._guild_cache = {}
+        self._guild_cache: OrderedDict = OrderedDict()
         self._cache_ttl = 300  # 5 minutes
-        self._last_cache_update = {}
-        self._save_lock = asyncio.Lock()
-        self._position_lock = asyncio.Lock()  # Separate lock for positioning
+        self._cache_max = 4096
+        self._save_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)  # One lock per data file
+
+        # Positioning requests that land within the batch window are merged
+        # into one edit_role_positions call per guild
+        self._pending_positions: Dict[int, Dict[discord.Role, int]] = defaultdict(dict)
+        self._position_flush_tasks: Dict[int, asyncio.Task] = {}
+        self._position_batch_delay = 0.25  # Seconds to collect concurrent requests
         
         # Rate limiting for Discord API
-        self._last_api_call = {}
+        self._last_api_call: OrderedDict = OrderedDict()
         self._api_cooldown = 1.0  # Minimum seconds between API calls
         
+        # Debounced persistence: save_* mark a file dirty, the background
+        # flusher coalesces bursts into one write per debounce window
+        self._dirty: set = set()
+        self._flush_event = asyncio.Event()
+        self._flush_delay = 0.5  # Seconds to wait for more mutations
+        self._flusher_task: Optional[asyncio.Task] = None
+
         # Ensure data directory exists
         os.makedirs('data', exist_ok=True)
-        
-        # Set up logging
-        self.logger = logging.getLogger(__name__)
+
+    async def cog_load(self):
+        """Start the background save flusher and the orphan janitor"""
+        self._flusher_task = asyncio.create_task(self._flusher())
+        self._janitor.start()
+
+    async def cog_unload(self):
+        """Stop background tasks and write out anything still pending"""
+        self._janitor.cancel()
+        if self._flusher_task:
+            self._flusher_task.cancel()
+        await self._flush_dirty()
+
+    @tasks.loop(hours=1)
+    async def _janitor(self):
+        """Sweep orphaned role data across all guilds once an hour"""
+        for guild in self.bot.guilds:
+            try:
+                await self.cleanup_orphaned_role_data(guild)
+            except Exception as e:
+                self.logger.error(f"Janitor cleanup failed for guild {guild.id}: {e}")
+
+    @_janitor.before_loop
+    async def _janitor_wait_ready(self):
+        await self.bot.wait_until_ready()
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        self._bot_user_id = self.bot.user.id
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        """Sweep stale data as soon as the bot (re)joins a guild"""
+        await self.cleanup_orphaned_role_data(guild)
+
+    async def _flusher(self):
+        """Coalesce save requests: wake on dirty, debounce, write once"""
+        while True:
+            await self._flush_event.wait()
+            self._flush_event.clear()
+            await asyncio.sleep(self._flush_delay)
+            try:
+                await self._flush_dirty()
+            except Exception:
+                # A transient write failure (disk full, EPERM) must not end
+                # this task — the dirty flag was restored below, so back off
+                # and wake again to retry. save_data_atomic already logged it
+                await asyncio.sleep(5)
+                self._flush_event.set()
+
+    async def _flush_dirty(self):
+        """Write the combined state file through the atomic saver if dirty"""
+        if not self._dirty:
+            return
+        pending = set(self._dirty)
+        self._dirty.clear()
+        state = {'guild_roles': self.custom_roles, 'user_roles': self.user_custom_roles}
+        try:
+            await self.save_data_atomic(state, self.state_file)
+        except Exception:
+            # Put the dirty state back so the retry actually has work to do
+            self._dirty |= pending
+            raise
+
+    def load_state(self) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+        """Load the combined state file, falling back to the legacy split files"""
+        if os.path.exists(self.state_file):
+            try:
+                with open(self.state_file, 'rb') as f:
+                    data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+                if isinstance(data, dict):
+                    return data.get('guild_roles', {}), data.get('user_roles', {})
+            except (json.JSONDecodeError, ValueError, PermissionError) as e:
+                self.logger.error(f"Error loading custom roles state: {e}")
+            return {}, {}
+
+        # Legacy layout: two separate files, merged on next save
+        return self.load_custom_roles(), self.load_user_custom_roles()
 
     def load_custom_roles(self) -> Dict[str, Dict]:
         """Load custom roles with better error handling"""
@@ -44,8 +155,8 @@ class CustomRoles(commands.Cog):
             return {}
         
         try:
-            with open(self.custom_roles_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.custom_roles_file, 'rb') as f:
+                data = orjson.loads(f.read()) if orjson is not None else json.load(f)
                 return data if isinstance(data, dict) else {}
         except (json.JSONDecodeError, FileNotFoundError, PermissionError) as e:
             self.logger.error(f"Error loading custom roles: {e}")
@@ -57,8 +168,8 @@ class CustomRoles(commands.Cog):
             return {}
         
         try:
-            with open(self.user_roles_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.user_roles_file, 'rb') as f:
+                data = orjson.loads(f.read()) if orjson is not None else json.load(f)
                 return data if isinstance(data, dict) else {}
         except (json.JSONDecodeError, FileNotFoundError, PermissionError) as e:
             self.logger.error(f"Error loading user custom roles: {e}")
@@ -66,34 +177,45 @@ class CustomRoles(commands.Cog):
 
     async def save_data_atomic(self, data: dict, filepath: str):
         """Atomic save with backup for any data file"""
-        async with self._save_lock:
+        # Serialize outside the lock (the CPU cost) so concurrent savers of
+        # the other file aren't held up, then do the blocking disk work in a
+        # thread; the per-file lock only orders writers of the same file.
+        # Compact output: these files are machine-read, the indent just
+        # doubled the bytes written per save
+        if orjson is not None:
+            payload = orjson.dumps(data)
+        else:
+            payload = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        async with self._save_locks[filepath]:
             try:
-                # Create backup if file exists
-                if os.path.exists(filepath):
-                    backup_file = f"{filepath}.backup"
-                    with open(filepath, 'r', encoding='utf-8') as src, \
-                         open(backup_file, 'w', encoding='utf-8') as dst:
-                        dst.write(src.read())
-                
-                # Write to temporary file first
-                temp_file = f"{filepath}.tmp"
-                with open(temp_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                
-                # Atomic replace
-                os.replace(temp_file, filepath)
-                
+                await asyncio.to_thread(self._write_atomic, filepath, payload)
             except Exception as e:
                 self.logger.error(f"Error saving {filepath}: {e}")
                 raise
 
+    def _write_atomic(self, filepath: str, payload: bytes):
+        """Blocking write: temp file, keep previous generation, atomic replace
+        (runs in a thread)"""
+        # Write to temporary file first
+        temp_file = f"{filepath}.tmp"
+        with open(temp_file, 'wb') as f:
+            f.write(payload)
+
+        # Keep one previous generation via rename (a directory-entry update,
+        # not a full copy of the dataset), then swap the new file in
+        if os.path.exists(filepath):
+            os.replace(filepath, f"{filepath}.prev")
+        os.replace(temp_file, filepath)
+
     async def save_custom_roles(self):
-        """Save custom roles"""
-        await self.save_data_atomic(self.custom_roles, self.custom_roles_file)
+        """Queue a save of the combined state (coalesced by the flusher)"""
+        self._dirty.add(self.state_file)
+        self._flush_event.set()
 
     async def save_user_custom_roles(self):
-        """Save user custom roles"""
-        await self.save_data_atomic(self.user_custom_roles, self.user_roles_file)
+        """Queue a save of the combined state (coalesced by the flusher)"""
+        self._dirty.add(self.state_file)
+        self._flush_event.set()
 
     def validate_role_name(self, name: str) -> Tuple[bool, str]:
         """Validate role name with detailed feedback"""
@@ -107,11 +229,11 @@ class CustomRoles(commands.Cog):
             return False, "Role name cannot exceed 100 characters"
         
         # Check for problematic characters and Discord markdown
-        if re.search(r'[@#`\\*_~|]', name):
+        if _RE_BAD_NAME.search(name):
             return False, "Role name contains invalid characters"
         
         # Check for excessive whitespace
-        if re.search(r'\s{3,}', name):
+        if _RE_WS.search(name):
             return False, "Role name has too much whitespace"
         
         return True, name
@@ -125,118 +247,147 @@ class CustomRoles(commands.Cog):
         
         # Support 3-digit hex codes
         if len(hex_color) == 3:
-            hex_color = ''.join([c*2 for c in hex_color])
-        
-        if not re.match(r"^[0-9A-Fa-f]{6}$", hex_color):
-            return None
+            hex_color = hex_color[0]*2 + hex_color[1]*2 + hex_color[2]*2
         
-        try:
-            color_value = int(hex_color, 16)
-            return discord.Color(color_value)
-        except (ValueError, OverflowError):
+        # Explicit hex-digit check: int(x, 16) alone is too permissive —
+        # it also accepts a '0x' prefix, signs ('+12345'), surrounding
+        # whitespace, and non-ASCII digits
+        if len(hex_color) != 6 or not all(c in string.hexdigits for c in hex_color):
             return None
 
+        return discord.Color(int(hex_color, 16))
+
     async def get_cached_guild_data(self, guild: discord.Guild) -> dict:
-        """Get cached guild data including roles and bot permissions"""
-        cache_key = f"guild_{guild.id}"
-        current_time = datetime.now(timezone.utc).timestamp()
-        
-        # Check cache validity
-        if (cache_key in self._guild_cache and 
-            cache_key in self._last_cache_update and
-            current_time - self._last_cache_update[cache_key] < self._cache_ttl):
-            return self._guild_cache[cache_key]
-        
-        # Refresh cache
-        bot_member = guild.get_member(self.bot.user.id)
+        """Get cached guild data: role positions and bot permissions"""
+        cached = self._guild_cache.get(guild.id)
+        if cached is not None and time.monotonic() < cached[0]:
+            self._guild_cache.move_to_end(guild.id)
+            return cached[1]
+
+        # Refresh cache with scalars only; callers re-fetch the actual
+        # Member/Role objects on demand (both are plain dict lookups)
+        bot_member = guild.get_member(self._bot_user_id or self.bot.user.id)
         target_role = guild.get_role(self.target_role_id)
-        
+
         cache_data = {
-            'bot_member': bot_member,
-            'target_role': target_role,
+            'target_role_found': target_role is not None,
             'bot_top_role_position': bot_member.top_role.position if bot_member else 0,
             'target_role_position': target_role.position if target_role else 0,
             'can_manage_roles': bot_member.guild_permissions.manage_roles if bot_member else False
         }
-        
-        self._guild_cache[cache_key] = cache_data
-        self._last_cache_update[cache_key] = current_time
-        
+
+        self._guild_cache[guild.id] = (time.monotonic() + self._cache_ttl, cache_data)
+        self._guild_cache.move_to_end(guild.id)
+        while len(self._guild_cache) > self._cache_max:
+            self._guild_cache.popitem(last=False)
+
         return cache_data
 
     async def rate_limit_api_call(self, key: str):
         """Simple rate limiting for API calls"""
-        current_time = datetime.now(timezone.utc).timestamp()
+        # monotonic: no datetime allocation per gate, immune to clock jumps
+        current_time = time.monotonic()
         last_call = self._last_api_call.get(key, 0)
-        
+
         if current_time - last_call < self._api_cooldown:
             sleep_time = self._api_cooldown - (current_time - last_call)
             await asyncio.sleep(sleep_time)
-        
-        self._last_api_call[key] = datetime.now(timezone.utc).timestamp()
+
+        self._last_api_call[key] = time.monotonic()
+        self._last_api_call.move_to_end(key)
+        while len(self._last_api_call) > self._cache_max:
+            self._last_api_call.popitem(last=False)
 
     async def position_role_optimized(self, role: discord.Role, guild: discord.Guild) -> bool:
         """Optimized role positioning with better logic"""
-        async with self._position_lock:  # Prevent concurrent positioning
+        try:
+            # Permission checks, position math, and the already-in-place
+            # early return all run lock-free on cached data
+            guild_data = await self.get_cached_guild_data(guild)
+
+            if not guild_data['can_manage_roles']:
+                self.logger.warning(f"No permission to manage roles in guild {guild.id}")
+                return False
+
+            if not guild_data['target_role_found']:
+                self.logger.warning(f"Target role {self.target_role_id} not found in guild {guild.id}")
+                return False
+
+            # Calculate optimal position
+            bot_max_position = guild_data['bot_top_role_position'] - 1
+            target_position = guild_data['target_role_position']
+            desired_position = min(bot_max_position, target_position + 1)
+
+            # Check if already in correct position
+            if abs(role.position - desired_position) <= 1:
+                return True
+
+            # Queue the move and ride the guild's in-flight flush if one is
+            # already collecting; every caller shares its result
+            self._pending_positions[guild.id][role] = desired_position
+            flush = self._position_flush_tasks.get(guild.id)
+            if flush is None or flush.done():
+                flush = asyncio.create_task(self._flush_positions(guild))
+                self._position_flush_tasks[guild.id] = flush
+
+            return await flush
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error positioning role: {e}")
+            return False
+
+    async def _flush_positions(self, guild: discord.Guild) -> bool:
+        """Apply every positioning request queued for a guild in one API call"""
+        await asyncio.sleep(self._position_batch_delay)
+        # The collection window closes with the batch: retire the registry
+        # entry in the same step (no await between the two pops), so a
+        # request arriving during the API call or its retries starts a
+        # fresh flush instead of awaiting one that doesn't contain it
+        self._position_flush_tasks.pop(guild.id, None)
+        positions = self._pending_positions.pop(guild.id, {})
+        if not positions:
+            return True
+
+        max_retries = 3
+        for attempt in range(max_retries):
             try:
-                guild_data = await self.get_cached_guild_data(guild)
-                
-                if not guild_data['can_manage_roles']:
-                    self.logger.warning(f"No permission to manage roles in guild {guild.id}")
-                    return False
-                
-                if not guild_data['target_role']:
-                    self.logger.warning(f"Target role {self.target_role_id} not found in guild {guild.id}")
-                    return False
-                
-                # Calculate optimal position
-                bot_max_position = guild_data['bot_top_role_position'] - 1
-                target_position = guild_data['target_role_position']
-                desired_position = min(bot_max_position, target_position + 1)
-                
-                # Check if already in correct position
-                if abs(role.position - desired_position) <= 1:
-                    return True
-                
-                # Rate limit the positioning call
+                # No user-land lock here: there is one flush task per guild,
+                # and discord.py's HTTP client already queues conflicting
+                # requests per rate-limit bucket. The local cooldown remains
                 await self.rate_limit_api_call(f"position_role_{guild.id}")
-                
-                # Use modify_role_positions for more precise control
-                positions = {role: desired_position}
                 await guild.edit_role_positions(positions, reason="Positioning custom role")
-                
+
                 # Invalidate cache after successful positioning
-                cache_key = f"guild_{guild.id}"
-                if cache_key in self._guild_cache:
-                    del self._guild_cache[cache_key]
-                    del self._last_cache_update[cache_key]
-                
+                self._guild_cache.pop(guild.id, None)
+
                 return True
-                
             except discord.HTTPException as e:
-                if e.status == 429:  # Rate limited
+                if e.status == 429 and attempt < max_retries - 1:
+                    # Jitter the retry so concurrent creations don't all
+                    # wake and hit the endpoint at the same instant
                     retry_after = getattr(e, 'retry_after', 2.0)
                     self.logger.warning(f"Rate limited positioning role, waiting {retry_after}s")
-                    await asyncio.sleep(retry_after)
-                    return False
-                else:
-                    self.logger.error(f"HTTP error positioning role: {e}")
-                    return False
-            except Exception as e:
-                self.logger.error(f"Unexpected error positioning role: {e}")
+                    await asyncio.sleep(retry_after + random.random() * 0.25)
+                    continue
+                self.logger.error(f"HTTP error positioning role: {e}")
                 return False
 
+        return False
+
     async def cleanup_orphaned_role_data(self, guild: discord.Guild):
         """Clean up data for roles that no longer exist"""
         guild_id = str(guild.id)
         if guild_id not in self.user_custom_roles:
             return 0
         
-        to_remove = []
-        for user_id, role_data in self.user_custom_roles[guild_id].items():
-            role_id = role_data.get('role_id')
-            if role_id and not guild.get_role(role_id):
-                to_remove.append(user_id)
+        # One snapshot of the guild's role ids, then set-membership tests,
+        # instead of a get_role call per stored user
+        existing_ids = {role.id for role in guild.roles}
+        to_remove = [
+            user_id
+            for user_id, role_data in self.user_custom_roles[guild_id].items()
+            if role_data.get('role_id') and role_data['role_id'] not in existing_ids
+        ]
         
         for user_id in to_remove:
             del self.user_custom_roles[guild_id][user_id]
@@ -273,7 +424,11 @@ class CustomRoles(commands.Cog):
         user = interaction.user
         user_id = str(user.id)
         guild_id = str(guild.id)
-        
+
+        # Normalize once; these are reused across branches below
+        color_lc = color.lower()
+        display_name = user.display_name
+
         # Get cached guild data
         guild_data = await self.get_cached_guild_data(guild)
         
@@ -299,17 +454,19 @@ class CustomRoles(commands.Cog):
                 await existing_role.edit(
                     name=validated_name, 
                     color=discord_color,
-                    reason=f"Custom role updated by {user.display_name}"
+                    reason=f"Custom role updated by {display_name}"
                 )
                 
                 # Position the role
                 positioning_success = await self.position_role_optimized(existing_role, guild)
                 
                 # Update data
+                now = datetime.now(timezone.utc)
                 self.user_custom_roles[guild_id][user_id].update({
                     'name': validated_name,
-                    'color': color.lower(),
-                    'updated_at': datetime.now(timezone.utc).isoformat()
+                    'color': color_lc,
+                    'updated_at': now.isoformat(),
+                    'updated_ts': int(now.timestamp())
                 })
                 
                 await self.save_user_custom_roles()
@@ -337,7 +494,7 @@ class CustomRoles(commands.Cog):
                 name=validated_name,
                 color=discord_color,
                 mentionable=True,
-                reason=f"Custom role created by {user.display_name}"
+                reason=f"Custom role created by {display_name}"
             )
             
             # Position the role immediately after creation
@@ -359,15 +516,19 @@ class CustomRoles(commands.Cog):
                             pass
                         await interaction.followup.send(f"❌ Created role but failed to assign: {str(e)}", ephemeral=True)
                         return
-                    await asyncio.sleep(1)
+                    # Exponential backoff with jitter, capped at 8s
+                    await asyncio.sleep(min(8.0, (2 ** attempt) * 0.5) + random.random() * 0.3)
             
             # Store data
+            now = datetime.now(timezone.utc)
             self.user_custom_roles[guild_id][user_id] = {
                 'role_id': new_role.id,
                 'name': validated_name,
-                'color': color.lower(),
-                'created_at': datetime.now(timezone.utc).isoformat(),
-                'updated_at': datetime.now(timezone.utc).isoformat()
+                'color': color_lc,
+                'created_at': now.isoformat(),
+                'updated_at': now.isoformat(),
+                'created_ts': int(now.timestamp()),
+                'updated_ts': int(now.timestamp())
             }
             
             await self.save_user_custom_roles()
@@ -449,6 +610,27 @@ class CustomRoles(commands.Cog):
             self.logger.error(f"Error deleting custom role: {e}")
             await interaction.followup.send("❌ An error occurred while deleting the role.", ephemeral=True)
 
+    def _role_timestamp(self, role_data: dict, field: str) -> Optional[int]:
+        """Unix timestamp for a role record, upgrading legacy ISO-only rows"""
+        ts = role_data.get(f'{field}_ts')
+        if ts is not None:
+            return ts
+
+        # Legacy row stores only the ISO string (always written with an
+        # explicit offset): parse once, cache the int so views skip the
+        # parse from then on, and let the flusher persist the upgrade
+        iso = role_data.get(f'{field}_at')
+        if not iso:
+            return None
+        try:
+            ts = int(datetime.fromisoformat(iso).timestamp())
+        except (ValueError, AttributeError):
+            return None
+        role_data[f'{field}_ts'] = ts
+        self._dirty.add(self.state_file)
+        self._flush_event.set()
+        return ts
+
     @app_commands.command(name="mycustomrole", description="View your custom role information")
     async def view_custom_role(self, interaction: discord.Interaction):
         guild = interaction.guild
@@ -482,21 +664,13 @@ class CustomRoles(commands.Cog):
         embed.add_field(name="Members", value=str(len(role.members)), inline=True)
         embed.add_field(name="Role ID", value=str(role.id), inline=True)
         
-        if role_data.get('created_at'):
-            try:
-                created_dt = datetime.fromisoformat(role_data['created_at'].replace('Z', '+00:00'))
-                created_timestamp = int(created_dt.timestamp())
-                embed.add_field(name="Created", value=f"<t:{created_timestamp}:R>", inline=True)
-            except (ValueError, AttributeError):
-                pass
-        
-        if role_data.get('updated_at') and role_data.get('updated_at') != role_data.get('created_at'):
-            try:
-                updated_dt = datetime.fromisoformat(role_data['updated_at'].replace('Z', '+00:00'))
-                updated_timestamp = int(updated_dt.timestamp())
-                embed.add_field(name="Last Updated", value=f"<t:{updated_timestamp}:R>", inline=True)
-            except (ValueError, AttributeError):
-                pass
+        created_ts = self._role_timestamp(role_data, 'created')
+        if created_ts:
+            embed.add_field(name="Created", value=f"<t:{created_ts}:R>", inline=True)
+
+        updated_ts = self._role_timestamp(role_data, 'updated')
+        if updated_ts and updated_ts != created_ts:
+            embed.add_field(name="Last Updated", value=f"<t:{updated_ts}:R>", inline=True)
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -529,11 +703,12 @@ class CustomRoles(commands.Cog):
         embed = discord.Embed(title="🔧 Role System Information", color=0x5865f2)
         embed.add_field(name="Bot Can Manage Roles", value="✅" if guild_data['can_manage_roles'] else "❌", inline=True)
         embed.add_field(name="Bot Top Role Position", value=str(guild_data['bot_top_role_position']), inline=True)
-        embed.add_field(name="Target Role Found", value="✅" if guild_data['target_role'] else "❌", inline=True)
-        
-        if guild_data['target_role']:
-            embed.add_field(name="Target Role Position", value=str(guild_data['target_role_position']), inline=True)
-            embed.add_field(name="Target Role Name", value=guild_data['target_role'].name, inline=True)
+        embed.add_field(name="Target Role Found", value="✅" if guild_data['target_role_found'] else "❌", inline=True)
+
+        target_role = interaction.guild.get_role(self.target_role_id)
+        if target_role:
+            embed.add_field(name="Target Role Position", value=str(target_role.position), inline=True)
+            embed.add_field(name="Target Role Name", value=target_role.name, inline=True)
         
         # Count active custom roles
         guild_id = str(interaction.guild.id)
@@ -22,32 +22,33 @@ class FunCommands(commands.Cog):
         # Animation timing
         self.ANIMATION_DELAY = 3  # Reduced from 5 seconds for better UX
 
+        # Embed templates built once; commands copy them and patch only the
+        # dynamic title/color instead of rebuilding every field per call
+        self._coin_embeds = [
+            self._create_embed(title="🪙 Flipping Coin...", color=0xFFFF00, image_url=sticker)
+            for sticker in self.COIN_STICKERS
+        ]
+        self._dice_anim_embed = self._create_embed(
+            title="🎲 Rolling...", color=0xFFFF00, image_url=self.DICE_STICKER
+        )
+
     @app_commands.command(name="coinflip", description="Flip a coin!")
     async def coinflip(self, interaction: discord.Interaction):
         """Flip a coin and get heads or tails"""
-        chosen_sticker = random.choice(self.COIN_STICKERS)
-        
-        # Create animation embed
-        animation_embed = self._create_embed(
-            title="🪙 Flipping Coin...",
-            color=0xFFFF00,
-            image_url=chosen_sticker
-        )
-        
-        await interaction.response.send_message(embed=animation_embed)
+        template = random.choice(self._coin_embeds)
+
+        await interaction.response.send_message(embed=template)
         await asyncio.sleep(self.ANIMATION_DELAY)
-        
+
         # Generate result
         result = random.choice(["Heads", "Tails"])
-        color = 0x00FF00 if result == "Heads" else 0xFF0000
-        
-        # Create result embed
-        result_embed = self._create_embed(
-            title=f"🪙 Coin Flip Result: {result}!",
-            color=color,
-            image_url=chosen_sticker
-        )
-        
+
+        # Result reuses the animation template (same sticker), patching
+        # only the title and color
+        result_embed = template.copy()
+        result_embed.title = f"🪙 Coin Flip Result: {result}!"
+        result_embed.color = 0x00FF00 if result == "Heads" else 0xFF0000
+
         await interaction.edit_original_response(embed=result_embed)
 
     @app_commands.command(name="roll", description="Roll custom dice (e.g., 1d6, 2d20)")
@@ -67,17 +68,14 @@ class FunCommands(commands.Cog):
         num_dice, die_sides = validation_result["num_dice"], validation_result["die_sides"]
         
         # Show animation
-        animation_embed = self._create_embed(
-            title=f"🎲 Rolling {dice.upper()}...",
-            color=0xFFFF00,
-            image_url=self.DICE_STICKER
-        )
-        
+        animation_embed = self._dice_anim_embed.copy()
+        animation_embed.title = f"🎲 Rolling {dice.upper()}..."
+
         await interaction.response.send_message(embed=animation_embed)
         await asyncio.sleep(self.ANIMATION_DELAY)
         
-        # Generate rolls
-        rolls = [random.randint(1, die_sides) for _ in range(num_dice)]
+        # Generate rolls in one C-level call instead of randint per die
+        rolls = random.choices(range(1, die_sides + 1), k=num_dice)
         
         # Create result embed
         result_embed = self._create_dice_result_embed(dice, rolls, num_dice)
@@ -135,8 +133,8 @@ class FunCommands(commands.Cog):
                 inline=False
             )
         else:
-            # Use more efficient string joining
-            rolls_str = ", ".join(str(roll) for roll in rolls)
+            # map(str, ...) stays at C level; a genexp pays a frame per roll
+            rolls_str = ", ".join(map(str, rolls))
             result_embed.add_field(
                 name="Individual Rolls",
                 value=rolls_str,
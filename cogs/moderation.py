@@ -1,8 +1,12 @@
 import discord
 from discord.ext import commands
 import asyncio
+import time
 from typing import List, Optional
-from datetime import datetime, timedelta
+
+# Discord epoch (2015-01-01) in milliseconds; message ids encode their
+# creation time as (unix_ms - epoch) << 22
+DISCORD_EPOCH_MS = 1420070400000
 
 class Moderation(commands.Cog):
     def __init__(self, bot):
@@ -13,6 +17,7 @@ class Moderation(commands.Cog):
         self.BULK_DELETE_LIMIT = 100
         self.MESSAGE_AGE_LIMIT = 14  # Days for bulk delete
         self.CONFIRMATION_DELAY = 3  # Seconds
+        self.MAX_CLEAR_RANGE = 1000  # Safety cap on history fetches per clear
 
     @commands.command(name="clear", help="Clear messages between start and end points")
     async def clear_messages(self, ctx, action: Optional[str] = None):
@@ -88,10 +93,16 @@ class Moderation(commands.Cog):
                 start_message, end_message = end_message, start_message
 
             messages_to_delete = await self._collect_messages_between(
-                ctx.channel, 
-                start_message, 
+                ctx.channel,
+                start_message,
                 end_message
             )
+            if len(messages_to_delete) >= self.MAX_CLEAR_RANGE:
+                await self._send_temp_message(
+                    ctx,
+                    f"⚠️ Range capped at {self.MAX_CLEAR_RANGE} messages; run the command again for the rest.",
+                    5
+                )
             messages_to_delete.append(ctx.message)
 
             if len(messages_to_delete) <= 1:
@@ -129,15 +140,24 @@ class Moderation(commands.Cog):
         try:
             target_message = await ctx.channel.fetch_message(ctx.message.reference.message_id)
             
-            # More efficient message collection
+            # Bounded fetch: oldest_first avoids an in-memory reverse and
+            # the cap keeps a bad range from pulling the whole channel
             messages_to_delete = []
             async for message in ctx.channel.history(
-                limit=None, 
-                before=ctx.message, 
-                after=target_message
+                limit=self.MAX_CLEAR_RANGE,
+                before=ctx.message,
+                after=target_message,
+                oldest_first=True
             ):
                 messages_to_delete.append(message)
-            
+
+            if len(messages_to_delete) >= self.MAX_CLEAR_RANGE:
+                await self._send_temp_message(
+                    ctx,
+                    f"⚠️ Range capped at {self.MAX_CLEAR_RANGE} messages; run the command again for the rest.",
+                    5
+                )
+
             messages_to_delete.append(ctx.message)
             
             if len(messages_to_delete) <= 1:
@@ -164,17 +184,27 @@ class Moderation(commands.Cog):
     ) -> List[discord.Message]:
         """Collect messages between two points efficiently"""
         messages = []
-        
-        # Use more efficient approach with limits
+        seen = set()
+
+        # Track ids so boundary messages can't end up in the list twice —
+        # duplicates make Discord reject the bulk delete and force the
+        # slow per-message fallback. The fetch is bounded and oldest-first
+        # so a mis-set range can't drag in the whole channel
         async for message in channel.history(
-            limit=None, 
-            before=end_message, 
-            after=start_message
+            limit=self.MAX_CLEAR_RANGE,
+            before=end_message,
+            after=start_message,
+            oldest_first=True
         ):
-            messages.append(message)
-        
+            if message.id not in seen:
+                seen.add(message.id)
+                messages.append(message)
+
         # Include the boundary messages
-        messages.extend([start_message, end_message])
+        for boundary in (start_message, end_message):
+            if boundary.id not in seen:
+                seen.add(boundary.id)
+                messages.append(boundary)
         return messages
 
     async def _delete_messages_efficiently(
@@ -187,12 +217,19 @@ class Moderation(commands.Cog):
             return 0
         
         deleted_count = 0
-        from datetime import timezone
-        cutoff_time = datetime.now(timezone.utc) - timedelta(days=self.MESSAGE_AGE_LIMIT)
-        
-        # Separate messages by age for optimal deletion strategy
-        recent_messages = [msg for msg in messages if msg.created_at > cutoff_time]
-        old_messages = [msg for msg in messages if msg.created_at <= cutoff_time]
+
+        # Message ids are snowflakes, so the age cutoff is plain integer
+        # arithmetic on time.time() — no datetime or timedelta allocation —
+        # and the per-message age test is a pure int compare
+        cutoff_ms = int((time.time() - self.MESSAGE_AGE_LIMIT * 86400) * 1000)
+        cutoff_snowflake = (cutoff_ms - DISCORD_EPOCH_MS) << 22
+
+        # Separate messages by age for optimal deletion strategy: one pass,
+        # with the append targets bound to locals
+        recent_messages, old_messages = [], []
+        add_recent, add_old = recent_messages.append, old_messages.append
+        for msg in messages:
+            (add_recent if msg.id > cutoff_snowflake else add_old)(msg)
         
         # Bulk delete recent messages in chunks
         deleted_count += await self._bulk_delete_messages(channel, recent_messages)
@@ -232,10 +269,11 @@ class Moderation(commands.Cog):
     async def _delete_old_messages(self, messages: List[discord.Message]) -> int:
         """Delete old messages individually with error handling"""
         deleted_count = 0
-        
-        # Use semaphore to limit concurrent deletions
-        semaphore = asyncio.Semaphore(10)  # Limit to 10 concurrent deletions
-        
+
+        # Cap our own fan-out loosely; discord.py's per-route rate limiter
+        # does the real throttling
+        semaphore = asyncio.Semaphore(32)
+
         async def delete_single_message(message):
             nonlocal deleted_count
             async with semaphore:
@@ -244,11 +282,12 @@ class Moderation(commands.Cog):
                     deleted_count += 1
                 except (discord.NotFound, discord.Forbidden):
                     pass
-        
-        # Delete messages concurrently but with limits
-        tasks = [delete_single_message(msg) for msg in messages]
-        await asyncio.gather(*tasks, return_exceptions=True)
-        
+
+        # Structured concurrency: no per-task exception list to allocate
+        async with asyncio.TaskGroup() as tg:
+            for msg in messages:
+                tg.create_task(delete_single_message(msg))
+
         return deleted_count
 
 async def setup(bot):
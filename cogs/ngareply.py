@@ -1,47 +1,112 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+import asyncio
 import json
 import os
 import re
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
+# Compiled once; is_url runs for every triggered reply
+_URL_RE = re.compile(
+    r'https?://(?:[-\w.])+(?::[0-9]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?',
+    re.IGNORECASE
+)
+
 class NgaReply(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger(__name__)
         self.data_file = Path('data/nga_replies.json')
         self.triggers = self.load_triggers()
-    
+
+        # One compiled alternation per guild: (pattern, matched word -> trigger
+        # data), so on_message is a single regex pass instead of a compile per
+        # trigger per message. Rebuilt whenever a guild's triggers change
+        self._guild_patterns = {}
+        for guild_id in self.triggers:
+            self._rebuild_pattern(guild_id)
+
+        # Debounce handle: rapid trigger edits coalesce into one disk write
+        self._flush_task = None
+
+    async def cog_unload(self):
+        """Flush any pending trigger save before the cog goes away"""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            self._write_triggers(self._serialize_triggers())
+
+    def _rebuild_pattern(self, guild_id):
+        """Recompile the union trigger pattern for one guild"""
+        guild_triggers = self.triggers.get(guild_id)
+        if not guild_triggers:
+            self._guild_patterns.pop(guild_id, None)
+            return
+
+        word_to_data = {}
+        for trigger_key, data in guild_triggers.items():
+            word_to_data[trigger_key] = data
+            for alternative in data["alternatives"]:
+                word_to_data.setdefault(alternative, data)
+
+        pattern = re.compile(
+            r'\b(' + '|'.join(re.escape(word) for word in word_to_data) + r')\b',
+            re.IGNORECASE
+        )
+        # Both cases of every trigger's first character; a C-level
+        # isdisjoint against the content skips the regex for messages
+        # that can't possibly match
+        firstchars = frozenset(
+            c for word in word_to_data for c in (word[0].lower(), word[0].upper())
+        )
+        self._guild_patterns[guild_id] = (pattern, word_to_data, firstchars)
+
     def load_triggers(self):
         """Load trigger data from JSON file"""
         try:
             if self.data_file.exists():
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                raw = self.data_file.read_bytes()
+                return orjson.loads(raw) if orjson is not None else json.loads(raw)
             return {}
         except Exception as e:
             self.logger.error(f"Error loading triggers: {e}")
             return {}
     
     def save_triggers(self):
-        """Save trigger data to JSON file"""
+        """Queue a save of the triggers; edits within the window coalesce"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_triggers())
+
+    def _serialize_triggers(self) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(self.triggers)
+        return json.dumps(self.triggers, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    async def _flush_triggers(self):
+        """Debounced write: serialize on the loop, hit the disk in a thread"""
+        await asyncio.sleep(0.5)
         try:
-            # Ensure data directory exists
-            self.data_file.parent.mkdir(exist_ok=True)
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.triggers, f, indent=2, ensure_ascii=False)
+            payload = self._serialize_triggers()
+            await asyncio.to_thread(self._write_triggers, payload)
         except Exception as e:
             self.logger.error(f"Error saving triggers: {e}")
+
+    def _write_triggers(self, payload: bytes):
+        """Blocking atomic write of the serialized triggers"""
+        self.data_file.parent.mkdir(exist_ok=True)
+        temp_file = self.data_file.with_name(self.data_file.name + '.tmp')
+        temp_file.write_bytes(payload)
+        os.replace(temp_file, self.data_file)
     
     def is_url(self, text):
         """Check if text is a URL"""
-        url_pattern = re.compile(
-            r'https?://(?:[-\w.])+(?::[0-9]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?',
-            re.IGNORECASE
-        )
-        return bool(url_pattern.match(text.strip()))
+        return bool(_URL_RE.match(text.strip()))
     
     @app_commands.command(name="nga", description="Set up a trigger word with a custom reply")
     @app_commands.describe(
@@ -59,7 +124,7 @@ class NgaReply(commands.Cog):
             return
         
         guild_id = str(interaction.guild.id)
-        trigger_key = text.lower().strip()
+        trigger_key = text.strip().lower()
         
         # Initialize guild data if not exists
         if guild_id not in self.triggers:
@@ -75,6 +140,7 @@ class NgaReply(commands.Cog):
         }
         
         self.save_triggers()
+        self._rebuild_pattern(guild_id)
         
         embed = discord.Embed(
             title="✅ Trigger Set Up",
@@ -109,8 +175,8 @@ class NgaReply(commands.Cog):
             return
         
         guild_id = str(interaction.guild.id)
-        main_key = main_trigger.lower().strip()
-        alt_key = alternative.lower().strip()
+        main_key = main_trigger.strip().lower()
+        alt_key = alternative.strip().lower()
         
         # Check if main trigger exists
         if guild_id not in self.triggers or main_key not in self.triggers[guild_id]:
@@ -131,6 +197,7 @@ class NgaReply(commands.Cog):
         # Add alternative
         self.triggers[guild_id][main_key]["alternatives"].append(alt_key)
         self.save_triggers()
+        self._rebuild_pattern(guild_id)
         
         embed = discord.Embed(
             title="✅ Alternative Added",
@@ -192,7 +259,7 @@ class NgaReply(commands.Cog):
             return
         
         guild_id = str(interaction.guild.id)
-        trigger_key = trigger.lower().strip()
+        trigger_key = trigger.strip().lower()
         
         if guild_id not in self.triggers or trigger_key not in self.triggers[guild_id]:
             await interaction.response.send_message(
@@ -204,6 +271,7 @@ class NgaReply(commands.Cog):
         # Remove trigger
         del self.triggers[guild_id][trigger_key]
         self.save_triggers()
+        self._rebuild_pattern(guild_id)
         
         embed = discord.Embed(
             title="🗑️ Trigger Removed",
@@ -224,32 +292,19 @@ class NgaReply(commands.Cog):
         if not message.guild:
             return
         
-        guild_id = str(message.guild.id)
-        
-        # Check if guild has any triggers
-        if guild_id not in self.triggers or not self.triggers[guild_id]:
+        # Single precompiled scan over the raw content; IGNORECASE replaces
+        # the per-message lower()/strip() copies
+        entry = self._guild_patterns.get(str(message.guild.id))
+        if entry is None:
             return
-        
-        message_content = message.content.lower().strip()
-        
-        # Early return if message is empty
-        if not message_content:
+
+        pattern, word_to_data, firstchars = entry
+        if firstchars.isdisjoint(message.content):
             return
-        
-        # Check each trigger
-        for main_word, data in self.triggers[guild_id].items():
-            # Use word boundaries for better matching
-            pattern = r'\b' + re.escape(main_word) + r'\b'
-            if re.search(pattern, message_content):
-                await self.send_reply(message, data)
-                return
-            
-            # Check alternatives with word boundaries
-            for alternative in data["alternatives"]:
-                alt_pattern = r'\b' + re.escape(alternative) + r'\b'
-                if re.search(alt_pattern, message_content):
-                    await self.send_reply(message, data)
-                    return
+
+        match = pattern.search(message.content)
+        if match:
+            await self.send_reply(message, word_to_data[match.group(1).lower()])
     
     async def send_reply(self, message, trigger_data):
         """Send the reply for a triggered word"""
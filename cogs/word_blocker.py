@@ -3,93 +3,290 @@ from discord.ext import commands
 from discord import app_commands
 import json
 import os
+import re
 import asyncio
-from typing import Dict, List, Set
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
 class WordBlocker(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.logger = logging.getLogger(__name__)
         self.data_dir = 'data'
-        self.blocked_words_file = os.path.join(self.data_dir, 'blocked_words.json')
-        self.blocked_words: Dict[str, Set[str]] = {}
+        # One small file per user: an edit rewrites only that user's words
+        # instead of every user's. The old single-file layout is migrated
+        # on first load
+        self.blocked_words_dir = os.path.join(self.data_dir, 'blocked_words')
+        self.legacy_words_file = os.path.join(self.data_dir, 'blocked_words.json')
+        # LRU over recently active users' word sets; cold users stay on
+        # disk and load on demand, so memory stays bounded however many
+        # users are configured
+        self.blocked_words: OrderedDict[int, Set[str]] = OrderedDict()
+        self._cache_max = 512
         self._file_lock = asyncio.Lock()
         
         # Performance optimization: cache for faster lookups
-        self._users_with_blocks: Set[str] = set()
-        
+        self._users_with_blocks: Set[int] = set()
+
+        # True while anyone at all has blocked words; lets check_blocked_words
+        # bail on a single truthiness test when the feature is unused
+        self._any_blocks = False
+
+        # One compiled alternation per user so a message is scanned once for
+        # all of that user's words instead of once per word. Entries are
+        # dropped on edit and rebuilt lazily on the next check
+        self._user_patterns: Dict[int, re.Pattern] = {}
+
+        # Both cases of every word's first character; a C-level isdisjoint
+        # against the raw content rejects messages that can't match before
+        # we pay for the lowercase copy and the regex scan
+        self._user_firstchars: Dict[int, frozenset] = {}
+
+        # Shortest blocked word per user: messages shorter than it can't
+        # contain any word, so they skip the scan on a length compare
+        self._min_word_len: Dict[int, int] = {}
+
+        # Sorted view for the list command, so repeat listings don't
+        # re-sort the same unchanged set
+        self._sorted_words: Dict[int, List[str]] = {}
+
+        # Coalesced persistence: commands mark the edited user dirty and a
+        # single background task flushes after a short window, so a burst
+        # of admin edits becomes one small rewrite per touched user
+        self._dirty_users: Set[int] = set()
+        self._dirty = asyncio.Event()
+        self._flush_delay = 1.0
+        self._flusher_task: Optional[asyncio.Task] = None
+
         # Ensure data directory exists and load data
         self._ensure_data_directory()
         self._load_blocked_words()
-        
-        # Setup logging
-        self.logger = logging.getLogger(__name__)
+
+    async def cog_load(self):
+        """Start the background flush task"""
+        self._flusher_task = asyncio.create_task(self._flush_loop())
+
+    async def cog_unload(self):
+        """Stop the flusher and write any pending changes"""
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+        if self._dirty_users:
+            await self._save_blocked_words()
+
+    async def _flush_loop(self):
+        """Flush dirty state to disk, absorbing edits made within the window"""
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(self._flush_delay)
+            self._dirty.clear()
+            await self._save_blocked_words()
+
+    def _mark_dirty(self, user_id: int):
+        """Queue one user's file for the next flush"""
+        self._dirty_users.add(user_id)
+        self._dirty.set()
 
     def _ensure_data_directory(self):
-        """Ensure the data directory exists"""
-        os.makedirs(self.data_dir, exist_ok=True)
+        """Ensure the data directories exist"""
+        os.makedirs(self.blocked_words_dir, exist_ok=True)
 
     def _load_blocked_words(self):
-        """Load blocked words from JSON file with error handling"""
-        if not os.path.exists(self.blocked_words_file):
-            return
-        
+        """Index which users have blocked words; word sets load on demand"""
+        if os.path.exists(self.legacy_words_file):
+            self._migrate_legacy_file()
+
+        for filename in os.listdir(self.blocked_words_dir):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                self._users_with_blocks.add(int(filename[:-5]))
+            except ValueError:
+                continue
+        self._any_blocks = bool(self._users_with_blocks)
+
+    def _get_user_words(self, user_id: int) -> Optional[Set[str]]:
+        """Return a user's word set, loading their file on a cache miss.
+
+        Returns None only when the user genuinely has no words; a file
+        that exists but fails to load raises, so callers can't mistake
+        a transient read error for an empty blocklist and overwrite it.
+        """
+        words = self.blocked_words.get(user_id)
+        if words is not None:
+            self.blocked_words.move_to_end(user_id)
+            return words
+
+        if user_id not in self._users_with_blocks:
+            return None
+
+        user_file = os.path.join(self.blocked_words_dir, f"{user_id}.json")
+        with open(user_file, 'rb') as f:
+            raw = f.read()
+        words = set(orjson.loads(raw) if orjson is not None else json.loads(raw))
+
+        self.blocked_words[user_id] = words
+        self._evict_cold_users()
+        return words
+
+    def _evict_cold_users(self):
+        """Drop least-recently-used word sets (and derived caches) over the cap"""
+        # One bounded pass in LRU order: each resident entry is considered
+        # at most once, so an all-dirty cache ends the scan instead of
+        # spinning on it. The newest entry is exempt — it's the set the
+        # caller is about to use (and possibly mutate)
+        for evict_id in list(self.blocked_words)[:-1]:
+            if len(self.blocked_words) <= self._cache_max:
+                break
+            if evict_id in self._dirty_users:
+                # Unflushed edits: keep it resident until the next flush
+                continue
+            del self.blocked_words[evict_id]
+            self._user_patterns.pop(evict_id, None)
+            self._user_firstchars.pop(evict_id, None)
+            self._min_word_len.pop(evict_id, None)
+            self._sorted_words.pop(evict_id, None)
+
+    def _migrate_legacy_file(self):
+        """Split the old single blocked_words.json into per-user files"""
         try:
-            with open(self.blocked_words_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Convert lists to sets for O(1) lookup performance
-                self.blocked_words = {
-                    user_id: set(words) for user_id, words in data.items()
-                }
-                self._users_with_blocks = set(self.blocked_words.keys())
-        except (json.JSONDecodeError, FileNotFoundError) as e:
-            self.logger.error(f"Error loading blocked words: {e}")
-            self.blocked_words = {}
-            self._users_with_blocks = set()
+            with open(self.legacy_words_file, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            for user_id, words in data.items():
+                self._write_user_file(user_id, list(words))
+            # Keep the original around as a one-off backup
+            os.replace(self.legacy_words_file, self.legacy_words_file + '.legacy')
+            self.logger.info("Migrated %d users to per-user blocked-word files", len(data))
+        except (ValueError, OSError) as e:
+            self.logger.error("Error migrating legacy blocked words file: %s", e)
 
     async def _save_blocked_words(self):
-        """Save blocked words to JSON file asynchronously with file locking"""
+        """Flush dirty users' files; each write is one small file"""
         async with self._file_lock:
+            dirty, self._dirty_users = self._dirty_users, set()
+            for user_id in dirty:
+                # Snapshot on the loop (sets can mutate between awaits),
+                # then encode and write in a worker thread so message
+                # dispatch keeps running during the disk I/O. A user with
+                # no words left has their file removed
+                words = self.blocked_words.get(user_id)
+                snapshot = list(words) if words else None
+                try:
+                    await asyncio.to_thread(self._write_user_file, user_id, snapshot)
+                except Exception as e:
+                    self.logger.error("Error saving blocked words for %s: %s", user_id, e)
+
+    def _write_user_file(self, user_id: int, words: Optional[List[str]]):
+        """Blocking atomic write (or removal) of one user's file"""
+        user_file = os.path.join(self.blocked_words_dir, f"{user_id}.json")
+        if words is None:
             try:
-                # Convert sets back to lists for JSON serialization
-                data_to_save = {
-                    user_id: list(words) for user_id, words in self.blocked_words.items()
-                }
-                
-                # Write to temporary file first, then rename for atomic operation
-                temp_file = self.blocked_words_file + '.tmp'
-                with open(temp_file, 'w', encoding='utf-8') as f:
-                    json.dump(data_to_save, f, indent=2, ensure_ascii=False)
-                
-                # Atomic rename
-                os.replace(temp_file, self.blocked_words_file)
-                
-            except Exception as e:
-                self.logger.error(f"Error saving blocked words: {e}")
+                os.remove(user_file)
+            except FileNotFoundError:
+                pass
+            return
+
+        # Compact bytes: no indent to format, fewer bytes to write
+        if orjson is not None:
+            payload = orjson.dumps(words)
+        else:
+            payload = json.dumps(
+                words, separators=(',', ':'), ensure_ascii=False
+            ).encode('utf-8')
+
+        # Write to temporary file first, then rename for atomic operation
+        temp_file = user_file + '.tmp'
+        with open(temp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(temp_file, user_file)
+
+    def has_any_blocks_sync(self, user_id: int) -> bool:
+        """Sync fast path: does this user have blocked words at all?
+
+        Lets the bot's on_message skip awaiting check_blocked_words — and
+        the coroutine scheduling that costs — for the vast majority of
+        messages whose author has nothing configured.
+        """
+        return self._any_blocks and user_id in self._users_with_blocks
 
     async def check_blocked_words(self, message: discord.Message) -> bool:
         """Optimized blocked word checking with early returns"""
         if message.author.bot:
             return False
-        
-        user_id = str(message.author.id)
-        
+
+        # DMs and system messages (pins, boosts, joins) aren't moderated;
+        # bail before any dict work. Replies still count as user content
+        if message.guild is None or message.type not in (
+            discord.MessageType.default, discord.MessageType.reply
+        ):
+            return False
+
+        # Nobody has blocked words at all — the common case on most
+        # installs — so skip even the set probe
+        if not self._any_blocks:
+            return False
+
+        # Discord ids are already ints; keying by int skips a per-message
+        # str() allocation and hashes faster
+        user_id = message.author.id
+
         # Fast path: check if user has any blocked words
         if user_id not in self._users_with_blocks:
             return False
         
-        blocked_words_for_user = self.blocked_words.get(user_id)
+        # A load failure fails open: the message passes unmoderated this
+        # time rather than poisoning state, and the next one retries
+        try:
+            blocked_words_for_user = self._get_user_words(user_id)
+        except (ValueError, OSError) as e:
+            self.logger.error("Error loading blocked words for %s: %s", user_id, e)
+            return False
         if not blocked_words_for_user:
             return False
         
-        message_content = message.content.lower()
-        
-        # Use any() for early termination
-        if any(word in message_content for word in blocked_words_for_user):
+        min_len = self._min_word_len.get(user_id)
+        if min_len is None:
+            min_len = min(map(len, blocked_words_for_user))
+            self._min_word_len[user_id] = min_len
+
+        if len(message.content) < min_len:
+            return False
+
+        firstchars = self._user_firstchars.get(user_id)
+        if firstchars is None:
+            firstchars = frozenset(
+                c for word in blocked_words_for_user
+                for c in (word[0], word[0].upper())
+            )
+            self._user_firstchars[user_id] = firstchars
+
+        if firstchars.isdisjoint(message.content):
+            return False
+
+        # Single case-insensitive pass over the raw content checks every
+        # word simultaneously — no per-message lowercase copy, no substring
+        # scan per blocked word
+        pattern = self._user_patterns.get(user_id)
+        if pattern is None:
+            pattern = self._build_pattern(blocked_words_for_user)
+            self._user_patterns[user_id] = pattern
+
+        if pattern.search(message.content):
             return await self._handle_blocked_message(message)
-        
+
         return False
 
+    @staticmethod
+    def _build_pattern(words: Set[str]) -> re.Pattern:
+        """Compile one alternation matching any of the given words"""
+        return re.compile('|'.join(map(re.escape, words)), re.IGNORECASE)
+
     async def _handle_blocked_message(self, message: discord.Message) -> bool:
         """Handle a message containing blocked words"""
         try:
@@ -107,7 +304,7 @@ class WordBlocker(commands.Cog):
             return True
         except discord.Forbidden:
             # No permission to delete
-            self.logger.warning(f"No permission to delete message from {message.author}")
+            self.logger.warning("No permission to delete message from %s", message.author)
             return False
 
     @app_commands.command(name="blockword", description="Add a blocked word for a specific user")
@@ -139,24 +336,42 @@ class WordBlocker(commands.Cog):
             )
             return
         
-        user_id = str(user.id)
-        
+        user_id = user.id
+
+        # Abort rather than treat a failed load as an empty set: marking
+        # a fresh set dirty here would flush it over the user's real file
+        try:
+            words = self._get_user_words(user_id)
+        except (ValueError, OSError) as e:
+            self.logger.error("Error loading blocked words for %s: %s", user_id, e)
+            await interaction.response.send_message(
+                f"❌ Couldn't load the existing blocked words for {user.display_name} — please try again!",
+                ephemeral=True
+            )
+            return
+
         # Initialize user's blocked words set if needed
-        if user_id not in self.blocked_words:
-            self.blocked_words[user_id] = set()
+        if words is None:
+            words = set()
+            self.blocked_words[user_id] = words
             self._users_with_blocks.add(user_id)
-        
+            self._any_blocks = True
+
         # Check if word is already blocked
-        if normalized_word in self.blocked_words[user_id]:
+        if normalized_word in words:
             await interaction.response.send_message(
                 f"❌ The word '{normalized_word}' is already blocked for {user.display_name}!",
                 ephemeral=True
             )
             return
-        
+
         # Add the word
-        self.blocked_words[user_id].add(normalized_word)
-        await self._save_blocked_words()
+        words.add(normalized_word)
+        self._user_patterns.pop(user_id, None)
+        self._user_firstchars.pop(user_id, None)
+        self._min_word_len.pop(user_id, None)
+        self._sorted_words.pop(user_id, None)
+        self._mark_dirty(user_id)
         
         await interaction.response.send_message(
             f"✅ Successfully blocked the word '{normalized_word}' for {user.display_name}!",
@@ -184,33 +399,47 @@ class WordBlocker(commands.Cog):
             return
         
         normalized_word = self._validate_and_normalize_word(word)
-        user_id = str(user.id)
+        user_id = user.id
         
         # Check if user has blocked words
-        if user_id not in self.blocked_words or not self.blocked_words[user_id]:
+        try:
+            words = self._get_user_words(user_id)
+        except (ValueError, OSError) as e:
+            self.logger.error("Error loading blocked words for %s: %s", user_id, e)
+            await interaction.response.send_message(
+                f"❌ Couldn't load the blocked words for {user.display_name} — please try again!",
+                ephemeral=True
+            )
+            return
+        if not words:
             await interaction.response.send_message(
                 f"❌ No blocked words found for {user.display_name}!",
                 ephemeral=True
             )
             return
-        
+
         # Check if word is blocked
-        if normalized_word not in self.blocked_words[user_id]:
+        if normalized_word not in words:
             await interaction.response.send_message(
                 f"❌ The word '{normalized_word}' is not blocked for {user.display_name}!",
                 ephemeral=True
             )
             return
-        
+
         # Remove the word
-        self.blocked_words[user_id].discard(normalized_word)
-        
+        words.discard(normalized_word)
+        self._user_patterns.pop(user_id, None)
+        self._user_firstchars.pop(user_id, None)
+        self._min_word_len.pop(user_id, None)
+        self._sorted_words.pop(user_id, None)
+
         # Clean up empty sets
-        if not self.blocked_words[user_id]:
+        if not words:
             del self.blocked_words[user_id]
             self._users_with_blocks.discard(user_id)
-        
-        await self._save_blocked_words()
+            self._any_blocks = bool(self._users_with_blocks)
+
+        self._mark_dirty(user_id)
         
         await interaction.response.send_message(
             f"✅ Successfully unblocked the word '{normalized_word}' for {user.display_name}!",
@@ -233,17 +462,31 @@ class WordBlocker(commands.Cog):
             )
             return
         
-        user_id = str(user.id)
+        user_id = user.id
         
         # Check if user has blocked words
-        if user_id not in self.blocked_words or not self.blocked_words[user_id]:
+        try:
+            words = self._get_user_words(user_id)
+        except (ValueError, OSError) as e:
+            self.logger.error("Error loading blocked words for %s: %s", user_id, e)
+            await interaction.response.send_message(
+                f"❌ Couldn't load the blocked words for {user.display_name} — please try again!",
+                ephemeral=True
+            )
+            return
+        if not words:
             await interaction.response.send_message(
                 f"📝 No blocked words found for {user.display_name}.",
                 ephemeral=True
             )
             return
-        
-        blocked_words_list = sorted(self.blocked_words[user_id])  # Sort for consistent display
+
+        # Sorted for consistent display; cached like the other derived
+        # structures and dropped on edit
+        blocked_words_list = self._sorted_words.get(user_id)
+        if blocked_words_list is None:
+            blocked_words_list = sorted(words)
+            self._sorted_words[user_id] = blocked_words_list
         
         # Handle large lists by truncating if necessary
         max_display = 50
@@ -279,20 +522,34 @@ class WordBlocker(commands.Cog):
             )
             return
         
-        user_id = str(user.id)
+        user_id = user.id
         
-        if user_id not in self.blocked_words or not self.blocked_words[user_id]:
+        try:
+            words = self._get_user_words(user_id)
+        except (ValueError, OSError) as e:
+            self.logger.error("Error loading blocked words for %s: %s", user_id, e)
+            await interaction.response.send_message(
+                f"❌ Couldn't load the blocked words for {user.display_name} — please try again!",
+                ephemeral=True
+            )
+            return
+        if not words:
             await interaction.response.send_message(
                 f"❌ No blocked words found for {user.display_name}!",
                 ephemeral=True
             )
             return
-        
-        word_count = len(self.blocked_words[user_id])
+
+        word_count = len(words)
         del self.blocked_words[user_id]
         self._users_with_blocks.discard(user_id)
+        self._any_blocks = bool(self._users_with_blocks)
+        self._user_patterns.pop(user_id, None)
+        self._user_firstchars.pop(user_id, None)
+        self._min_word_len.pop(user_id, None)
+        self._sorted_words.pop(user_id, None)
         
-        await self._save_blocked_words()
+        self._mark_dirty(user_id)
         
         await interaction.response.send_message(
             f"✅ Successfully cleared {word_count} blocked words for {user.display_name}!",
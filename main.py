@@ -7,6 +7,12 @@ from pathlib import Path
 import signal
 import sys
 
+try:
+    import uvloop
+    uvloop.install()  # Faster event loop for the bot's socket-heavy workload
+except ImportError:
+    uvloop = None  # Optional; stdlib asyncio loop works fine (e.g. on Windows)
+
 # Configure logging with better formatting
 logging.basicConfig(
     level=logging.INFO,
@@ -44,6 +50,9 @@ class OptimizedBot(commands.Bot):
             'cogs.anime_game'
         ]
         self._shutdown_event = asyncio.Event()
+        # Resolved once after cogs load; on_message runs for every message
+        # and shouldn't pay a get_cog lookup each time
+        self._word_blocker = None
 
     async def setup_hook(self):
         """Called when the bot is starting up"""
@@ -54,15 +63,16 @@ class OptimizedBot(commands.Bot):
         
         # Load all cogs
         await self.load_cogs()
-        
+        self._word_blocker = self.get_cog('WordBlocker')
+
         # Sync slash commands
         try:
             synced = await self.tree.sync()
-            self.logger.info(f"Synced {len(synced)} slash command(s)")
+            self.logger.info("Synced %d slash command(s)", len(synced))
         except discord.HTTPException as e:
-            self.logger.error(f"Failed to sync commands (HTTP): {e}")
+            self.logger.error("Failed to sync commands (HTTP): %s", e)
         except Exception as e:
-            self.logger.error(f"Failed to sync commands: {e}")
+            self.logger.error("Failed to sync commands: %s", e)
 
     async def load_cogs(self):
         """Load all cogs with error handling"""
@@ -70,16 +80,16 @@ class OptimizedBot(commands.Bot):
         for extension in self.startup_extensions:
             try:
                 await self.load_extension(extension)
-                self.logger.info(f"✅ Loaded {extension}")
+                self.logger.info("✅ Loaded %s", extension)
                 loaded_count += 1
             except commands.ExtensionNotFound:
-                self.logger.warning(f"⚠️  Extension {extension} not found")
+                self.logger.warning("⚠️  Extension %s not found", extension)
             except commands.ExtensionFailed as e:
-                self.logger.error(f"❌ Failed to load {extension}: {e}")
+                self.logger.error("❌ Failed to load %s: %s", extension, e)
             except Exception as e:
-                self.logger.error(f"❌ Unexpected error loading {extension}: {e}")
+                self.logger.error("❌ Unexpected error loading %s: %s", extension, e)
         
-        self.logger.info(f"Loaded {loaded_count}/{len(self.startup_extensions)} extensions")
+        self.logger.info("Loaded %d/%d extensions", loaded_count, len(self.startup_extensions))
 
     async def on_ready(self):
         """Called when bot is ready"""
@@ -95,15 +105,16 @@ class OptimizedBot(commands.Bot):
         if message.author.bot:
             return
         
-        # Process word blocking before other commands
-        word_blocker = self.get_cog('WordBlocker')
-        if word_blocker:
+        # Process word blocking before other commands; the sync probe keeps
+        # the no-blocks majority of messages out of the coroutine entirely
+        word_blocker = self._word_blocker
+        if word_blocker and word_blocker.has_any_blocks_sync(message.author.id):
             try:
                 blocked = await word_blocker.check_blocked_words(message)
                 if blocked:
                     return  # Message was deleted, don't process further
             except Exception as e:
-                self.logger.error(f"Error in word blocker: {e}")
+                self.logger.error("Error in word blocker: %s", e)
         
         await self.process_commands(message)
 
@@ -128,7 +139,7 @@ class OptimizedBot(commands.Bot):
             await self.safe_send(ctx, f"❌ Invalid argument provided: {error}", delete_after=5)
             return
         
-        self.logger.error(f"Command error in {ctx.command}: {error}")
+        self.logger.error("Command error in %s: %s", ctx.command, error)
         await self.safe_send(ctx, "❌ An unexpected error occurred!", delete_after=5)
 
     async def safe_send(self, ctx, content, **kwargs):
@@ -136,19 +147,19 @@ class OptimizedBot(commands.Bot):
         try:
             await ctx.send(content, **kwargs)
         except discord.Forbidden:
-            self.logger.warning(f"No permission to send message in {ctx.guild.name if ctx.guild else 'DM'}")
+            self.logger.warning("No permission to send message in %s", ctx.guild.name if ctx.guild else "DM")
         except discord.HTTPException as e:
-            self.logger.error(f"HTTP error sending message: {e}")
+            self.logger.error("HTTP error sending message: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error sending message: {e}")
+            self.logger.error("Unexpected error sending message: %s", e)
 
     async def on_guild_join(self, guild):
         """Log when bot joins a guild"""
-        self.logger.info(f"➕ Joined guild: {guild.name} (ID: {guild.id})")
+        self.logger.info("➕ Joined guild: %s (ID: %s)", guild.name, guild.id)
 
     async def on_guild_remove(self, guild):
         """Log when bot leaves a guild"""
-        self.logger.info(f"➖ Left guild: {guild.name} (ID: {guild.id})")
+        self.logger.info("➖ Left guild: %s (ID: %s)", guild.name, guild.id)
 
     async def close(self):
         """Cleanup when bot is shutting down"""
@@ -157,21 +168,21 @@ class OptimizedBot(commands.Bot):
         await super().close()
         self.logger.info("✅ Bot shutdown complete")
 
-def signal_handler(bot):
-    """Handle shutdown signals"""
-    def handler(signum, frame):
-        logging.info(f"Received signal {signum}, initiating shutdown...")
-        asyncio.create_task(bot.close())
-    return handler
-
 async def main():
     """Main function to run the bot"""
     bot = OptimizedBot()
-    
-    # Set up signal handlers for graceful shutdown
+
+    def request_shutdown(sig):
+        logging.info("Received signal %s, initiating shutdown...", sig.name)
+        asyncio.create_task(bot.close())
+
+    # Register shutdown signals on the loop itself: the callback then runs
+    # inside the event loop, where create_task is actually safe, instead of
+    # interrupting the main thread at an arbitrary point
     if sys.platform != 'win32':
-        signal.signal(signal.SIGTERM, signal_handler(bot))
-        signal.signal(signal.SIGINT, signal_handler(bot))
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, request_shutdown, sig)
     
     # Get token from environment variable or file
     token = os.getenv('BOT_TOKEN')
@@ -185,7 +196,7 @@ async def main():
                 logging.error("❌ No bot token found! Set BOT_TOKEN environment variable or create token.txt")
                 return
         except Exception as e:
-            logging.error(f"❌ Error reading token file: {e}")
+            logging.error("❌ Error reading token file: %s", e)
             return
     
     if not token:
@@ -200,9 +211,9 @@ async def main():
     except discord.LoginFailure:
         logging.error("❌ Invalid bot token!")
     except discord.HTTPException as e:
-        logging.error(f"❌ HTTP error: {e}")
+        logging.error("❌ HTTP error: %s", e)
     except Exception as e:
-        logging.error(f"❌ Bot crashed: {e}")
+        logging.error("❌ Bot crashed: %s", e)
     finally:
         if not bot.is_closed():
             await bot.close()
@@ -213,5 +224,5 @@ if __name__ == '__main__':
     except KeyboardInterrupt:
         logging.info("🛑 Program interrupted")
     except Exception as e:
-        logging.error(f"❌ Fatal error: {e}")
+        logging.error("❌ Fatal error: %s", e)
         sys.exit(1)
\ No newline at end of file